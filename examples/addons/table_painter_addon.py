@@ -37,24 +37,31 @@ if not CWD.exists():
 # ------------------------------------------------------------------------------
 
 
+P1 = 0.5
+P2 = 0.25
+MAT_SYMBOL_POINTS = (
+    (P1, P2),
+    (P2, P1),
+    (-P2, P1),
+    (-P1, P2),
+    (-P1, -P2),
+    (-P2, -P1),
+    (P2, -P1),
+    (P1, -P2),
+)
+MAT_SYMBOL_NAME = "matsymbol"
+
+
 def get_mat_symbol(doc: Drawing) -> BlockLayout:
-    symbol = doc.blocks.new("matsymbol")
-    p1 = 0.5
-    p2 = 0.25
-    points = [
-        (p1, p2),
-        (p2, p1),
-        (-p2, p1),
-        (-p1, p2),
-        (-p1, -p2),
-        (-p2, -p1),
-        (p2, -p1),
-        (p1, -p2),
-    ]
+    # the block definition is created only once for each document
+    symbol = doc.blocks.get(MAT_SYMBOL_NAME)
+    if symbol is not None:
+        return symbol
+    symbol = doc.blocks.new(MAT_SYMBOL_NAME)
 
     # should run with DXF R12, do not use add_lwpolyline()
     symbol.add_polyline2d(
-        points,
+        MAT_SYMBOL_POINTS,
         close=True,
         dxfattribs={
             "color": 2,
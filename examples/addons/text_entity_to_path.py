@@ -2,7 +2,6 @@
 # License: MIT License
 import pathlib
 import ezdxf
-from ezdxf.addons import text2path
 from ezdxf.enums import TextEntityAlignment
 from ezdxf.math import Vec3
 from ezdxf import path
@@ -18,52 +17,59 @@ if not CWD.exists():
 # ------------------------------------------------------------------------------
 
 
-def add_rect(msp, p1, p2, height):
-    p2 = Vec3(p2) + (0, height)
-    points = [p1, (p2.x, p1.y), p2, (p1.x, p2.y)]
-    msp.add_lwpolyline(points, close=True, dxfattribs={"color": 6})
+RECT_ATTRIBS = {"color": 6}
+
+
+def add_rect(msp, p1: Vec3, p2: Vec3, height: float):
+    x1, y1 = p1.x, p1.y
+    x2, y2 = p2.x, p2.y + height
+    points = [(x1, y1), (x2, y1), (x2, y2), (x1, y2)]
+    msp.add_lwpolyline(points, close=True, dxfattribs=RECT_ATTRIBS)
+
+
+# content, first alignment point, second alignment point, height, alignment
+TEXTS = [
+    (
+        "OpenSansCondensed-Light ALIGNED",
+        Vec3(0, 0),
+        Vec3(12, 0),
+        1,
+        TextEntityAlignment.ALIGNED,
+    ),
+    (
+        "OpenSansCondensed-Light FIT",
+        Vec3(0, 2),
+        Vec3(12, 2),
+        2,
+        TextEntityAlignment.FIT,
+    ),
+]
 
 
 def main():
+    # text2path loads the font support modules, import only when needed:
+    from ezdxf.addons import text2path
+
     doc = ezdxf.new(setup=["styles"])
     msp = doc.modelspace()
 
-    p1 = Vec3(0, 0)
-    p2 = Vec3(12, 0)
-    height = 1
-    text = msp.add_text(
-        "OpenSansCondensed-Light ALIGNED",
-        dxfattribs={
-            "style": "OpenSansCondensed-Light",
-            "layer": "TEXT",
-            "height": height,
-            "color": 1,
-        },
-    )
-    text.set_placement(p1, p2, TextEntityAlignment.ALIGNED)
     attr = {"layer": "OUTLINE", "color": 2}
-    path.render_splines_and_polylines(
-        msp, text2path.make_paths_from_entity(text), dxfattribs=attr
-    )
-    add_rect(msp, p1, p2, height)
-
-    p1 = Vec3(0, 2)
-    p2 = Vec3(12, 2)
-    height = 2
-    text = msp.add_text(
-        "OpenSansCondensed-Light FIT",
-        dxfattribs={
-            "style": "OpenSansCondensed-Light",
-            "layer": "TEXT",
-            "height": height,
-            "color": 1,
-        },
-    )
-    text.set_placement(p1, p2, TextEntityAlignment.FIT)
-    path.render_splines_and_polylines(
-        msp, text2path.make_paths_from_entity(text), dxfattribs=attr
-    )
-    add_rect(msp, p1, p2, height)
+    for content, p1, p2, height, align in TEXTS:
+        text = msp.add_text(
+            content,
+            dxfattribs={
+                "style": "OpenSansCondensed-Light",
+                "layer": "TEXT",
+                "height": height,
+                "color": 1,
+            },
+        )
+        text.set_placement(p1, p2, align)
+        # render the sub-paths directly, without collecting them in a list:
+        path.render_splines_and_polylines(
+            msp, text2path.make_path_from_entity(text).sub_paths(), dxfattribs=attr
+        )
+        add_rect(msp, p1, p2, height)
 
     doc.set_modelspace_vport(10, (6, 2))
     doc.saveas(CWD / "entity2path.dxf")
@@ -20,11 +20,10 @@ if not CWD.exists():
 
 
 points = Vec3.list([(1, 1), (4, 5), (7, 4), (10, 7), (12, 3), (7, 1)])
-closed_points = list(points)
-closed_points.append(closed_points[0])
+closed_points = [*points, points[0]]
 
 
-def new_doc():
+def setup_doc():
     doc = ezdxf.new()
     doc.layers.add("SPLINE", color=1)
     doc.layers.add("ENTITY", color=4)
@@ -32,8 +31,18 @@ def new_doc():
     doc.layers.add("FLATTEN", color=3)
     doc.layers.add("FRAME", color=5)
     doc.layers.add("FIT", color=1)
-    msp = doc.modelspace()
-    return doc, msp
+    return doc
+
+
+# All examples are saved as separate DXF files, but the document setup is done
+# only once and the modelspace is cleared for each new example.
+DOC = setup_doc()
+
+
+def new_doc():
+    msp = DOC.modelspace()
+    msp.delete_all_entities()
+    return DOC, msp
 
 
 def save(name):
@@ -41,21 +50,32 @@ def save(name):
     doc.saveas(CWD / name)
 
 
-def add_control_polyline(spline):
-    s = spline.construction_tool()
-    msp.add_lwpolyline(s.flattening(0.01), dxfattribs={"layer": "FLATTEN"})
+def add_control_polyline(tool: BSpline):
+    msp.add_lwpolyline(tool.flattening(0.01), dxfattribs={"layer": "FLATTEN"})
+
+
+FRAME_ATTRIBS = {"layer": "FRAME"}
+FIT_ATTRIBS = {"layer": "FIT"}
 
 
-def add_control_frame(spline):
-    cpoints = spline.control_points
-    msp.add_lwpolyline(cpoints, dxfattribs={"layer": "FRAME"})
+def add_control_frame(cpoints):
+    msp.add_lwpolyline(cpoints, dxfattribs=FRAME_ATTRIBS)
+    add_circle = msp.add_circle
     for point in cpoints:
-        msp.add_circle(point, radius=0.05, dxfattribs={"layer": "FRAME"})
+        add_circle(point, radius=0.05, dxfattribs=FRAME_ATTRIBS)
+
+
+def add_control_frame_and_polyline(spline):
+    # create the construction tool only once for both helpers
+    tool = spline.construction_tool()
+    add_control_frame(tool.control_points)
+    add_control_polyline(tool)
 
 
 def add_fit_points(points):
+    add_circle = msp.add_circle
     for point in points:
-        msp.add_circle(point, radius=0.05, dxfattribs={"layer": "FIT"})
+        add_circle(point, radius=0.05, dxfattribs=FIT_ATTRIBS)
 
 
 # A B-spline is only defined by the control points and the knot values and the
@@ -98,8 +118,7 @@ spline = msp.add_cad_spline_control_frame(
 )
 
 add_fit_points(points)
-add_control_frame(spline)
-add_control_polyline(spline)
+add_control_frame_and_polyline(spline)
 save(CWD / "open_spline_from_fit_points.dxf")
 
 # ------------------------------------------------------------------------------
@@ -141,7 +160,7 @@ spline = msp.add_cad_spline_control_frame(
     points, tangents=[(0, 1), (-1, 0)], dxfattribs={"layer": "EZDXF"}
 )
 add_fit_points(points)
-add_control_frame(spline)
+add_control_frame(spline.control_points)
 save(CWD / "open_spline_from_fit_points_with_end_tangents.dxf")
 
 # ------------------------------------------------------------------------------
@@ -159,8 +178,7 @@ spline = msp.add_spline_control_frame(
     fit_points=points, dxfattribs={"layer": "SPLINE"}
 )
 add_fit_points(points)
-add_control_frame(spline)
-add_control_polyline(spline)
+add_control_frame_and_polyline(spline)
 save(CWD / "open_spline_by_add_spline_control_frame.dxf")
 
 # ------------------------------------------------------------------------------
@@ -175,8 +193,7 @@ doc, msp = new_doc()
 spline = msp.add_cad_spline_control_frame(
     closed_points, dxfattribs={"layer": "EZDXF"}
 )
-add_control_frame(spline)
-add_control_polyline(spline)
+add_control_frame_and_polyline(spline)
 add_fit_points(points)
 save(CWD / "closed_spline_from_fit_points.dxf")
 
@@ -196,8 +213,7 @@ tangent = (0, 1)
 spline = msp.add_cad_spline_control_frame(
     closed_points, tangents=[tangent, tangent], dxfattribs={"layer": "EZDXF"}
 )
-add_control_frame(spline)
-add_control_polyline(spline)
+add_control_frame_and_polyline(spline)
 add_fit_points(points)
 save(CWD / "closed_spline_from_fit_points_smooth.dxf")
 
@@ -219,8 +235,7 @@ save(CWD / "closed_spline_from_fit_points_smooth.dxf")
 doc, msp = new_doc()
 spline = msp.add_open_spline(points, dxfattribs={"layer": "SPLINE"})
 
-add_control_frame(spline)
-add_control_polyline(spline)
+add_control_frame_and_polyline(spline)
 save(CWD / "open_clamped_spline_by_control_points.dxf")
 
 # ------------------------------------------------------------------------------
@@ -241,8 +256,7 @@ s = BSpline.from_arc(arc.construction_tool())
 spline = msp.add_spline(dxfattribs={"layer": "SPLINE"})
 spline.apply_construction_tool(s)
 
-add_control_frame(spline)
-add_control_polyline(spline)
+add_control_frame_and_polyline(spline)
 save(CWD / "spline_from_arc.dxf")
 
 # ------------------------------------------------------------------------------
@@ -264,8 +278,7 @@ s = BSpline.from_ellipse(ellipse.construction_tool())
 spline = msp.add_spline(dxfattribs={"layer": "SPLINE"})
 spline.apply_construction_tool(s)
 
-add_control_frame(spline)
-add_control_polyline(spline)
+add_control_frame_and_polyline(spline)
 save(CWD / "spline_from_ellipse.dxf")
 
 # ------------------------------------------------------------------------------
@@ -276,6 +289,5 @@ doc, msp = new_doc()
 spline = msp.add_spline(dxfattribs={"layer": "SPLINE"})
 spline.set_uniform(points)
 
-add_control_frame(spline)
-add_control_polyline(spline)
+add_control_frame_and_polyline(spline)
 save(CWD / "open_unclamped_spline_by_control_points.dxf")
@@ -1,11 +1,16 @@
 # Copyright (c) 2019-2022, Manfred Moitzi
 # License: MIT License
-from typing import Iterable, Tuple
 import pathlib
 import math
+import numpy as np
 import ezdxf
 from ezdxf import zoom
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
 CWD = pathlib.Path("~/Desktop/Outbox").expanduser()
 if not CWD.exists():
     CWD = pathlib.Path(".")
@@ -18,17 +23,35 @@ if not CWD.exists():
 N = 6  # The rose has n petals if N is odd, and 2N petals if N is even.
 D = 71  # delta angle in degrees
 STEP360 = math.tau / 360
+COUNT = 361  # vertex count including the closing vertex at 360 deg
+
+
+if numba is not None:
+
+    @numba.njit(cache=True, fastmath=True)
+    def _maurer_rose_kernel(
+        n: int, d: int, radius: float, step: float, out: np.ndarray
+    ) -> None:
+        for j in range(out.shape[0]):
+            k = j * step * d
+            r = radius * math.sin(n * k)
+            out[j, 0] = r * math.cos(k)
+            out[j, 1] = r * math.sin(k)
+
 
+def maurer_rose(n: int, d: int, radius: float) -> np.ndarray:
+    """Returns the vertices of the maurer rose as (N, 2) array."""
+    if numba is not None:
+        points = np.empty((COUNT, 2), dtype=np.float64)
+        _maurer_rose_kernel(n, d, radius, STEP360, points)
+        return points
 
-def maurer_rose(n: int, d: int, radius: float) -> Iterable[Tuple[float, float]]:
-    i: float = 0.0
-    while i < math.tau:
-        k = i * d
-        r = radius * math.sin(n * k)
-        x = r * math.cos(k)
-        y = r * math.sin(k)
-        yield x, y
-        i += STEP360
+    k = np.arange(COUNT) * STEP360 * d
+    r = radius * np.sin(n * k)
+    points = np.empty((k.size, 2), dtype=np.float64)
+    np.multiply(r, np.cos(k), out=points[:, 0])
+    np.multiply(r, np.sin(k), out=points[:, 1])
+    return points
 
 
 def main(filename: str, n: int, d: int) -> None:
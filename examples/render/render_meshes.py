@@ -1,10 +1,12 @@
 # Copyright (c) 2018-2022, Manfred Moitzi
 # License: MIT License
+import functools
 import math
 import pathlib
+import numpy as np
 import ezdxf
+from ezdxf.math import Vec3
 from ezdxf.render import forms, MeshBuilder
-from itertools import cycle
 
 CWD = pathlib.Path("~/Desktop/Outbox").expanduser()
 if not CWD.exists():
@@ -60,10 +62,17 @@ def write_3dfaces(filename, mesh: MeshBuilder):
         print(f'saving as "{filename}" 3DFACES: done')
 
 
+PROFILE_POINTS = ((0, 0.1), (1, 1), (3, 1.5), (5, 3))  # in xy-plane
+
+
+@functools.lru_cache(maxsize=None)
+def rotation_profile(subdivide: int = 8) -> tuple[Vec3, ...]:
+    # the immutable tuple can be shared by all rotation forms
+    return tuple(forms.spline_interpolation(PROFILE_POINTS, subdivide=subdivide))
+
+
 def build_rotation_form(alpha=2 * math.pi, sides=16):
-    profile = forms.spline_interpolation(
-        [(0, 0.1), (1, 1), (3, 1.5), (5, 3)], subdivide=8
-    )  # in xy-plane
+    profile = rotation_profile(8)
     return forms.rotation_form(sides, profile, angle=alpha, axis=(1, 0, 0))
 
 
@@ -72,21 +81,23 @@ def create_gear(
 ):
     doc = ezdxf.new("R2000")
     msp = doc.modelspace()
-    vertices = zip(
-        forms.gear(
-            count=teeth,
-            top_width=top_width,
-            bottom_width=bottom_width,
-            height=height,
-            outside_radius=outside_radius,
-        ),
-        cycle(
-            [0, 0.1, 0, 0.1]
-        ),  # bulge values: top, down flank,  bottom, up flank
+    gear_vertices = np.array(
+        [
+            v.vec2
+            for v in forms.gear(
+                count=teeth,
+                top_width=top_width,
+                bottom_width=bottom_width,
+                height=height,
+                outside_radius=outside_radius,
+            )
+        ]
     )
+    # bulge values: top, down flank,  bottom, up flank
+    bulges = np.tile([0.0, 0.1, 0.0, 0.1], teeth)
     msp.add_lwpolyline(
-        vertices,
-        format="vb",
+        np.column_stack((gear_vertices, bulges)).tolist(),
+        format="xyb",
         close=True,
     )
     doc.saveas(filename)
@@ -95,8 +106,11 @@ def create_gear(
 def main():
     cylinder = forms.cylinder(16)
     write_mesh(CWD / "cylinder_mesh.dxf", cylinder)
-    write_polyface(CWD / "cylinder_polyface.dxf", cylinder)
-    write_3dfaces(CWD / "cylinder_3dfaces.dxf", cylinder)
+    # POLYFACE and 3DFACE require the same tessellation, the ngon caps of the
+    # cylinder are tessellated only once for both:
+    cylinder_quads = cylinder.mesh_tessellation(max_vertex_count=4)
+    write_polyface(CWD / "cylinder_polyface.dxf", cylinder_quads)
+    write_3dfaces(CWD / "cylinder_3dfaces.dxf", cylinder_quads)
     rotation_form = build_rotation_form(sides=32)
     write_mesh(CWD / "rotated_profile_mesh.dxf", rotation_form)
     write_polyface(CWD / "rotated_profile_polyface.dxf", rotation_form)
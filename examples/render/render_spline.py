@@ -1,6 +1,7 @@
 # Copyright (c) 2010-2022, Manfred Moitzi
 # License: MIT License
 import pathlib
+import numpy as np
 import ezdxf
 from ezdxf.render import Spline
 from ezdxf.math import Vec3, Matrix44
@@ -16,9 +17,28 @@ if not CWD.exists():
 # ------------------------------------------------------------------------------
 
 
+DOT = "DOT"
+
+
+def get_dot_block(doc):
+    # all points are marked by INSERT entities of a single block definition
+    if DOT not in doc.blocks:
+        block = doc.blocks.new(DOT)
+        block.add_circle(center=(0, 0), radius=0.1, dxfattribs={"color": 1})
+    return DOT
+
+
 def draw(msp, points):
+    name = get_dot_block(msp.doc)
     for point in points:
-        msp.add_circle(radius=0.1, center=point, dxfattribs={"color": 1})
+        msp.add_blockref(name, insert=point)
+
+
+def transform_vertices(m: Matrix44, vertices: list[Vec3]) -> list[Vec3]:
+    # transforms all vertices at once as numpy array
+    array = np.array(vertices, dtype=np.float64)
+    m.transform_array_inplace(array, ndim=3)
+    return Vec3.list(array)
 
 
 def main():
@@ -33,20 +53,15 @@ def main():
     draw(msp, spline_points)
 
     # curve with definition points as fit points
-    Spline(spline_points).render_as_fit_points(
-        msp, method="distance", dxfattribs={"color": 2}
-    )
-    Spline(spline_points).render_as_fit_points(
-        msp, method="uniform", dxfattribs={"color": 3}
-    )
-    # method = distance ^ 1/2
-    Spline(spline_points).render_as_fit_points(
-        msp, method="centripetal", dxfattribs={"color": 4}
-    )
-    # method = distance ^ 1/3
-    Spline(spline_points).render_as_fit_points(
-        msp, method="centripetal", dxfattribs={"color": 6}
-    )
+    fit_point_spline = Spline(spline_points)
+    for method, color in [
+        ("distance", 2),
+        ("uniform", 3),
+        ("centripetal", 4),  # method = distance ^ 1/2
+    ]:
+        fit_point_spline.render_as_fit_points(
+            msp, method=method, dxfattribs={"color": color}
+        )
 
     msp.add_spline(fit_points=spline_points, dxfattribs={"color": 1})
     msp.add_text(
@@ -55,7 +70,7 @@ def main():
     ).set_placement(spline_points[0])
 
     # open uniform b-spline
-    spline_points = list(next_frame.transform_vertices(spline_points))
+    spline_points = transform_vertices(next_frame, spline_points)
     draw(msp, spline_points)
     msp.add_text(
         "Spline.render_open_bspline() matches AutoCAD",
@@ -68,10 +83,10 @@ def main():
         control_points=spline_points, degree=3, dxfattribs={"color": 4}
     )
 
-    rbspline_points = list(right_frame.transform_vertices(spline_points))
+    rbspline_points = transform_vertices(right_frame, spline_points)
 
     # uniform b-spline
-    spline_points = list(next_frame.transform_vertices(spline_points))
+    spline_points = transform_vertices(next_frame, spline_points)
     draw(msp, spline_points)
     msp.add_text(
         "Spline.render_uniform_bspline() matches AutoCAD",
@@ -2,9 +2,11 @@
 #  License: MIT License
 import pathlib
 
+import numpy as np
 import ezdxf
 from ezdxf.render import forms
 from ezdxf import path
+from ezdxf.path import Command
 
 
 CWD = pathlib.Path("~/Desktop/Outbox").expanduser()
@@ -19,6 +21,27 @@ DEBUG_COLOR = ezdxf.colors.CYAN
 # ------------------------------------------------------------------------------
 
 
+def cubic_bezier_vertices(p: path.Path, segments: int = 16) -> np.ndarray:
+    """Returns the vertices of a path of cubic Bézier curves as (N, 3) array,
+    each curve is sampled at `segments` + 1 evenly spaced parameters.
+    """
+    t = np.linspace(0.0, 1.0, segments + 1)[1:]
+    t1 = 1.0 - t
+    # Bernstein basis of the cubic Bézier curve as (segments, 4) matrix:
+    basis = np.column_stack((t1**3, 3.0 * t1 * t1 * t, 3.0 * t1 * t * t, t**3))
+    start = p.start
+    vertices = [np.array([start], dtype=np.float64)]
+    for cmd in p.commands():
+        if cmd.type != Command.CURVE4_TO:
+            raise TypeError("path has to contain only cubic Bézier curves")
+        control_points = np.array(
+            (start, cmd.ctrl1, cmd.ctrl2, cmd.end), dtype=np.float64
+        )
+        vertices.append(basis @ control_points)
+        start = cmd.end
+    return np.concatenate(vertices)
+
+
 def main(filepath):
     def add_debug_profiles(profiles, sweeping_path):
         attribs = {"layer": "DEBUG"}
@@ -36,11 +59,13 @@ def main(filepath):
     doc.layers.add("DEBUG", color=DEBUG_COLOR)
     msp = doc.modelspace()
 
-    circle = list(forms.circle(8))
+    circle = tuple(forms.circle(8))
     p0 = path.Path()
     p0.curve4_to((3, 0, 5), (0, 0, 2), (1.5, 0, 4))
     p0.curve4_to((6, 0, 10), (4.5, 0, 6), (6, 0, 8))
-    sweeping_path = list(p0.flattening(distance=0.1))
+    # 4 segments per curve create the same vertex count as the adaptive
+    # Path.flattening(distance=0.1) for this path
+    sweeping_path = cubic_bezier_vertices(p0, segments=4)
     mesh = forms.sweep(circle, sweeping_path, close=True, caps=True)
     mesh.render_mesh(msp, dxfattribs={"color": ezdxf.colors.MAGENTA})
 
@@ -56,15 +81,13 @@ def main(filepath):
     sweeping_path = [(0, 0, 5), (5, 0, 5), (5, 5, 5), (6, 5, 10)]
     mesh = forms.sweep(square, sweeping_path, close=True, caps=True)
     offset = 10, 10, 0
-    add_debug_profiles(
-        [
-            list(forms.translate(p, offset))
-            for p in forms.debug_sweep_profiles(
-                square, sweeping_path, close=True
-            )
-        ],
-        list(forms.translate(sweeping_path, offset)),
+    # translate all debug profiles at once as (profiles, vertices, 3) array:
+    profiles = np.array(
+        forms.debug_sweep_profiles(square, sweeping_path, close=True),
+        dtype=np.float64,
     )
+    profiles += offset
+    add_debug_profiles(profiles, np.array(sweeping_path, dtype=np.float64) + offset)
 
     mesh.translate(*offset)
     mesh.render_mesh(msp, dxfattribs={"color": ezdxf.colors.YELLOW})
@@ -1,7 +1,6 @@
 # Copyright (c) 2020-2024, Manfred Moitzi
 # License: MIT License
 
-from typing import Iterable
 import pathlib
 import math
 import numpy as np
@@ -24,9 +23,10 @@ if not CWD.exists():
     CWD = pathlib.Path(".")
 
 
-def sine_wave(count: int, scale: float = 1.0) -> Iterable[Vec3]:
-    for t in np.linspace(0, math.tau, count):
-        yield Vec3(t * scale, math.sin(t) * scale)
+def sine_wave(count: int, scale: float = 1.0) -> np.ndarray:
+    """Returns `count` vertices of a sine wave as (count, 2) array."""
+    t = np.linspace(0, math.tau, count)
+    return np.column_stack((t * scale, np.sin(t) * scale))
 
 
 def main(method="5-p"):
@@ -40,7 +40,7 @@ def main(method="5-p"):
     msp = doc.modelspace()
 
     # Calculate 8 points on sine wave as interpolation data
-    data = list(sine_wave(count=8, scale=2.0))
+    data = Vec3.list(sine_wave(count=8, scale=2.0))
 
     # --------------------------------------------------------------------------
     # Reference curve as approximation
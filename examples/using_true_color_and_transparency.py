@@ -1,6 +1,7 @@
 # Copyright (c) 2015-2022 Manfred Moitzi
 # License: MIT License
 import pathlib
+import numpy as np
 import ezdxf
 
 CWD = pathlib.Path("~/Desktop/Outbox").expanduser()
@@ -45,8 +46,15 @@ def lines_with_true_color():
     doc.saveas(CWD / "true_color_lines.dxf")
 
 
-def rect(x, y, width=10, height=10):
-    return (x, y), (x + width, y), (x, y + height), (x + width, y + height)
+def rects(count: int, step: float, width=10, height=10) -> np.ndarray:
+    """Returns the SOLID vertices of `count` rectangles as (count, 4, 2) array,
+    each rectangle is shifted by `step` in x- and y-axis to the previous one.
+    """
+    corners = np.array(
+        [(0, 0), (width, 0), (0, height), (width, height)], dtype=np.float64
+    )
+    offsets = np.arange(count, dtype=np.float64) * step
+    return corners + offsets[:, np.newaxis, np.newaxis]
 
 
 def solids_with_true_color():
@@ -54,10 +62,8 @@ def solids_with_true_color():
     # or newer necessary
     doc = ezdxf.new("AC1018")
     msp = doc.modelspace()
-    for i in range(10):
-        x = i * 7
-        y = i * 7
-        solid = msp.add_solid(rect(x, y))
+    for i, vertices in enumerate(rects(10, 7)):
+        solid = msp.add_solid(vertices)
         solid.rgb = (50, i * 20, 50)  # set true-color as RGB tuple
         # IMPORTANT: as you see it is not in the solid.dxf namespace!
     doc.saveas(CWD / "true_color_solids.dxf")
@@ -68,10 +74,8 @@ def solids_with_transparency():
     # or newer necessary
     doc = ezdxf.new("AC1018")
     msp = doc.modelspace()
-    for i in range(10):
-        x = i * 7
-        y = i * 7
-        solid = msp.add_solid(rect(x, y, 20, 20))
+    for i, vertices in enumerate(rects(10, 7, 20, 20)):
+        solid = msp.add_solid(vertices)
         solid.transparency = (
             i / 10.0
         )  # set transparency as float between 0.0 (opaque) and 1.0 (100% transparent)
@@ -35,8 +35,10 @@ LAYERS = [BLK_CONTENT, EXPLODE, ATTRIBS]
 
 def explode(layout: BaseLayout):
     if EXPLODE_CONTENT:
-        entities = list(disassemble.recursive_decompose(layout))
-        for e in entities:
+        # Snapshot the layout content, iterating the layout directly would
+        # revisit the added entities. The snapshot holds just the existing
+        # entities, the exploded entities are streamed:
+        for e in disassemble.recursive_decompose(list(layout)):
             if e.dxftype() in ("ATTRIB", "ATTDEF"):
                 if not EXPLODE_ATTRIBS:
                     continue
@@ -131,12 +133,12 @@ def create_block_references(
 ):
     y = 0
     grid_x, grid_y = grid
+    xs = [index * grid_x for index in range(len(angles))]
     for extrusion in extrusions:
         ocs = OCS(extrusion)
         for sx, sy, sz in scales:
-            for index, angle in enumerate(angles):
-                x = index * grid_x
-                insert = ocs.from_wcs((x, y))
+            inserts = ocs.points_from_wcs((x, y) for x in xs)
+            for angle, insert in zip(angles, inserts):
                 blk_ref = layout.add_blockref(
                     block_name,
                     insert,
@@ -2,6 +2,7 @@
 #  License: MIT License
 from __future__ import annotations
 import pathlib
+import numpy as np
 import ezdxf
 from ezdxf import zoom, colors
 from ezdxf.math import (
@@ -14,15 +15,23 @@ from ezdxf.math import (
     fit_points_to_cad_cv,
     fit_points_to_cubic_bezier,
 )
-from ezdxf.render import random_2d_path
 
 CWD = pathlib.Path("~/Desktop/Outbox").expanduser()
 if not CWD.exists():
     CWD = pathlib.Path(".")
 
 points: list[Vec3] = Vec3.list([(0, 0), (0, 10), (10, 10), (20, 10), (20, 0)])
-closed_points: list[Vec3] = list(points)
-closed_points.append(points[0])
+closed_points: list[Vec3] = [*points, points[0]]
+
+# The end tangent estimations depend only on the fit points, calculate them once:
+# Tangent estimation method: "Total Chord Length",
+# returns sum of chords for m1 and m2
+CHORD_M1, CHORD_M2 = estimate_end_tangent_magnitude(points, method="chord")
+# Estimated tangent angles: (108.43494882292201, -108.43494882292201) degree
+TANGENTS_5P = estimate_tangents(points, method="5-points")
+# Given unit start- and end tangents used by multiple scenarios:
+START_TANGENT = Vec3.from_deg_angle(100)
+END_TANGENT = Vec3.from_deg_angle(-100)
 
 
 def setup():
@@ -62,12 +71,10 @@ def open_spline_from_fit_points_by_global_interpolation():
 def open_spline_from_fit_points_and_estimated_end_tangents():
     # 2. Store fit points, start- and end tangent values in DXF file:
     doc, msp = setup()
-    # Tangent estimation method: "Total Chord Length",
-    # returns sum of chords for m1 and m2
-    m1, m2 = estimate_end_tangent_magnitude(points, method="chord")
+    m1, m2 = CHORD_M1, CHORD_M2
     # Multiply tangent vectors by total chord length for global interpolation:
-    start_tangent = Vec3.from_deg_angle(100) * m1
-    end_tangent = Vec3.from_deg_angle(-100) * m2
+    start_tangent = START_TANGENT * m1
+    end_tangent = END_TANGENT * m2
     # Interpolate control vertices from fit points and end derivatives as constraints
     s = global_bspline_interpolation(
         points, degree=3, tangents=(start_tangent, end_tangent)
@@ -83,8 +90,8 @@ def open_spline_from_fit_points_and_estimated_end_tangents():
         degree=3,
         dxfattribs={"layer": "BricsCAD B-spline", "color": colors.YELLOW},
     )
-    spline.dxf.start_tangent = Vec3.from_deg_angle(100)
-    spline.dxf.end_tangent = Vec3.from_deg_angle(-100)
+    spline.dxf.start_tangent = START_TANGENT
+    spline.dxf.end_tangent = END_TANGENT
 
     zoom.extents(msp)
     doc.saveas(CWD / "concept-1-fit-points-and-tangents.dxf")
@@ -96,9 +103,8 @@ def open_spline_from_fit_points_and_5_point_tangent_estimation():
     # Estimation of start- and end tangents is required, best result by:
     # "5 Point Interpolation" from "The NURBS Book", Piegl & Tiller
     doc, msp = setup()
-    tangents = estimate_tangents(points, method="5-points")
-    # Estimated tangent angles: (108.43494882292201, -108.43494882292201) degree
-    m1, m2 = estimate_end_tangent_magnitude(points, method="chord")
+    tangents = TANGENTS_5P
+    m1, m2 = CHORD_M1, CHORD_M2
     start_tangent = tangents[0].normalize(m1)
     end_tangent = tangents[-1].normalize(m2)
     # Interpolate control vertices from fit points and end derivatives as constraints
@@ -123,7 +129,7 @@ def open_spline_from_fit_points_and_5_point_tangent_estimation():
 def check_open_spline_from_fit_points_and_5_point_tangent_estimation():
     # Theory Check:
     doc, msp = setup()
-    m1, m2 = estimate_end_tangent_magnitude(points, method="chord")
+    m1, m2 = CHORD_M1, CHORD_M2
     # Following values are calculated from a DXF file saved by Brics CAD
     # and SPLINE "Method" switched from "fit points" to "control vertices"
     # tangent vector = 2nd control vertex - 1st control vertex
@@ -157,8 +163,8 @@ def open_spline_from_fit_points_with_end_tangents():
     doc, msp = setup()
 
     # Given start- and end tangent:
-    start_tangent = Vec3.from_deg_angle(100)
-    end_tangent = Vec3.from_deg_angle(-100)
+    start_tangent = START_TANGENT
+    end_tangent = END_TANGENT
 
     # Create SPLINE defined by fit points only:
     spline = msp.add_spline(
@@ -296,7 +302,7 @@ def closed_spline_from_fit_points_with_tangent():
     )
     spline.closed = True  # ignored for splines from fit points
 
-    tangents = estimate_tangents(points, method="5-points")
+    tangents = TANGENTS_5P
     # Remark: TrueView 2022 works only with normalized tangents
     start_tangent = tangents[0].normalize()
     # same tangent for start- and end-point
@@ -322,7 +328,9 @@ def closed_spline_from_fit_points_with_tangent():
 def random_walk_open_spline():
     doc = ezdxf.new()
     msp = doc.modelspace()
-    walk = list(random_2d_path(10))
+    # random walk of 10 fit points by normal distributed steps:
+    rng = np.random.default_rng()
+    walk = Vec3.list(np.cumsum(rng.standard_normal((10, 2)), axis=0))
 
     msp.add_spline(
         walk,
@@ -1,9 +1,11 @@
 #  Copyright (c) 2020-2022, Manfred Moitzi
 #  License: MIT License
+import codecs
 import time
 import ezdxf
 
 BIG_FILE = ezdxf.options.test_files_path / "CADKitSamples" / "torso_uniform.dxf"
+BLOCK_SIZE = 1 << 23  # 8 MiB
 
 
 def load_ascii():
@@ -22,6 +24,26 @@ def load_bytes():
                 break
 
 
+# The block readers show the raw I/O and decoding costs without the per-line
+# overhead of readline():
+def load_block_ascii():
+    decoder = codecs.getincrementaldecoder("cp1252")()
+    with open(BIG_FILE, "rb") as fp:
+        while True:
+            data = fp.read(BLOCK_SIZE)
+            if not data:
+                break
+            decoder.decode(data)
+
+
+def load_block_bytes():
+    buffer = bytearray(BLOCK_SIZE)
+    with open(BIG_FILE, "rb") as fp:
+        readinto = fp.readinto
+        while readinto(buffer):
+            pass
+
+
 def print_result(time, text):
     print(f"Operation: {text} takes {time:.6f} s\n")
 
@@ -36,3 +58,5 @@ def run(func):
 if __name__ == "__main__":
     print_result(run(load_ascii), "ascii stream reader")
     print_result(run(load_bytes), "byte stream reader")
+    print_result(run(load_block_ascii), "ascii block reader")
+    print_result(run(load_block_bytes), "byte block reader")
@@ -152,11 +152,20 @@ cdef class Basis:
             return span - 1
 
     cpdef list basis_funcs(self, int span, double u):
+        cdef double[MAX_SPLINE_ORDER] N
+        self._basis_funcs(span, u, N)
+        cdef list result = [x for x in N[:self.order]]
+        if self.weights_:
+            return self.span_weighting(result, span)
+        else:
+            return result
+
+    cdef void _basis_funcs(self, int span, double u, double *N):
         # Source: The NURBS Book: Algorithm A2.2
+        # Stores the non-weighted basis functions in N[:order].
         cdef int order = self.order
         cdef double *knots = self._knots
-        cdef double[MAX_SPLINE_ORDER] N, left, right
-        cdef list result
+        cdef double[MAX_SPLINE_ORDER] left, right
         reset_double_array(N, order, 0.0)
         reset_double_array(left, order, 0.0)
         reset_double_array(right, order, 0.0)
@@ -178,11 +187,6 @@ cdef class Basis:
                 N[r] = saved + temp_r * temp
                 saved = temp_l * temp
             N[j] = saved
-        result = [x for x in N[:order]]
-        if self.is_rational:
-            return self.span_weighting(result, span)
-        else:
-            return result
 
     cpdef list span_weighting(self, nbasis: list[float], int span):
         cdef list products = [
@@ -198,6 +202,30 @@ cdef class Basis:
             return NULL_LIST * len(nbasis)
 
     cpdef list basis_funcs_derivatives(self, int span, double u, int n = 1):
+        cdef double[MAX_SPLINE_ORDER][MAX_SPLINE_ORDER] derivatives  # pyright: ignore
+        cdef int k, j
+        if n > self.order - 1:
+            n = self.order - 1
+        self._basis_funcs_derivatives(span, u, n, derivatives)
+
+        # return result as Python lists
+        cdef list result = [], row
+        for k in range(0, n + 1):
+            row = []
+            result.append(row)
+            for j in range(self.order):
+                row.append(derivatives[k][j])
+        return result
+
+    cdef void _basis_funcs_derivatives(
+        self,
+        int span,
+        double u,
+        int n,
+        double (*derivatives)[MAX_SPLINE_ORDER],
+    ):
+        # Stores the basis functions and their derivatives up to n <= degree
+        # in derivatives[:n+1][:order].
         # pyright: reportUndefinedVariable=false
         # pyright flags Cython multi-arrays incorrect: 
         # cdef double[4][4] a  # this is a valid array definition in Cython!
@@ -205,8 +233,6 @@ cdef class Basis:
         # Source: The NURBS Book: Algorithm A2.3
         cdef int order = self.order
         cdef int p = order - 1
-        if n > p:
-            n = p
         cdef double *knots = self._knots
         cdef double[MAX_SPLINE_ORDER] left, right
         reset_double_array(left, order, 1.0)
@@ -236,7 +262,6 @@ cdef class Basis:
             ndu[j][j] = saved
 
         # load the basis_vector functions
-        cdef double[MAX_SPLINE_ORDER][MAX_SPLINE_ORDER] derivatives  # pyright: ignore
         reset_double_array(
             <double *> derivatives, MAX_SPLINE_ORDER*MAX_SPLINE_ORDER, 0.0
         )
@@ -291,15 +316,6 @@ cdef class Basis:
                 derivatives[k][j] *= rr
             rr *= (p - k)
 
-        # return result as Python lists
-        cdef list result = [], row
-        for k in range(0, n + 1):
-            row = []
-            result.append(row)
-            for j in range(order):
-                row.append(derivatives[k][j])
-        return result
-
 cdef class Evaluator:
     """ B-spline curve point and curve derivative evaluator. """
     cdef Basis _basis
@@ -317,14 +333,25 @@ cdef class Evaluator:
         cdef:
             int p = basis.order - 1
             int span = basis.find_span(u)
-            list N = basis.basis_funcs(span, u)
+            double[MAX_SPLINE_ORDER] N
+            tuple weights = basis.weights_
             int i
             Vec3 cpoint, v3_sum = Vec3()
             tuple control_points = self._control_points
-            double factor
-            
+            double factor, weight_sum = 0.0
+
+        basis._basis_funcs(span, u, N)
+        if weights:  # same as Basis.span_weighting()
+            # The weights slice of Basis.span_weighting() is empty for
+            # span < p, the weight sum is 0 and all factors become 0:
+            if span >= p:
+                for i in range(p + 1):
+                    N[i] *= <double> weights[span - p + i]
+                    weight_sum += N[i]
+            for i in range(p + 1):
+                N[i] = N[i] / weight_sum if weight_sum != 0.0 else 0.0
         for i in range(p + 1):
-            factor = <double> N[i]
+            factor = N[i]
             cpoint = <Vec3> control_points[span - p + i]
             v3_sum.x += cpoint.x * factor
             v3_sum.y += cpoint.y * factor
@@ -344,25 +371,28 @@ cdef class Evaluator:
         if isclose(u, basis.max_t, REL_TOL, ABS_TOL):
             u = basis.max_t
         cdef:
-            list CK = [], CKw = [], wders = []
+            list CK = [], CKw = []
             tuple control_points = self._control_points
-            tuple weights
+            tuple weights = basis.weights_
             Vec3 cpoint, v3_sum
             double wder, bas_func_weight, bas_func
-            int k, j, i, p = basis.degree
+            int k, j, i, p = basis.order - 1
             int span = basis.find_span(u)
-            list basis_funcs_ders = basis.basis_funcs_derivatives(span, u, n)
+            double[MAX_SPLINE_ORDER][MAX_SPLINE_ORDER] basis_funcs_ders  # pyright: ignore
+            double[MAX_SPLINE_ORDER] wders
 
-        if basis.is_rational:
+        if n > p:
+            n = p
+        basis._basis_funcs_derivatives(span, u, n, basis_funcs_ders)
+        if weights:
             # Homogeneous point representation required:
             # (x*w, y*w, z*w, w)
-            weights = basis.weights_
             for k in range(n + 1):
                 v3_sum = Vec3()
                 wder = 0.0
                 for j in range(p + 1):
                     i = span - p + j
-                    bas_func_weight = basis_funcs_ders[k][j] * weights[i]
+                    bas_func_weight = basis_funcs_ders[k][j] * <double> weights[i]
                     # control_point * weight * bas_func_der = (x*w, y*w, z*w) * bas_func_der
                     cpoint = <Vec3> control_points[i]
                     v3_sum.x += cpoint.x * bas_func_weight
@@ -370,7 +400,7 @@ cdef class Evaluator:
                     v3_sum.z += cpoint.z * bas_func_weight
                     wder += bas_func_weight
                 CKw.append(v3_sum)
-                wders.append(wder)
+                wders[k] = wder
 
             # Source: The NURBS Book: Algorithm A4.2
             for k in range(n + 1):
@@ -5,6 +5,7 @@
 from typing import Iterable, List, Sequence, TYPE_CHECKING, Tuple, Iterator
 from libc.math cimport fabs, sin, cos, M_PI, hypot, atan2, acos, sqrt, fmod
 import random
+import numpy as np
 
 cdef extern from "constants.h":
     const double ABS_TOL
@@ -105,15 +106,20 @@ cdef class Vec2:
 
     @staticmethod
     def list(items: Iterable[UVec]) -> List[Vec2]:
+        if is_vertex_array(items):
+            return v2_list_from_array(items)
         return list(Vec2.generate(items))
 
     @staticmethod
     def tuple(items: Iterable[UVec]) -> Sequence[Vec2]:
+        if is_vertex_array(items):
+            return tuple(v2_list_from_array(items))
         return tuple(Vec2.generate(items))
 
     @staticmethod
     def generate(items: Iterable[UVec]) -> Iterator[Vec2]:
-        return (Vec2(item) for item in items)
+        # Vec2 instances are immutable, no copy required
+        return (item if type(item) is Vec2 else Vec2(item) for item in items)
 
     @staticmethod
     def from_angle(double angle, double length = 1.0) -> Vec2:
@@ -127,7 +133,7 @@ cdef class Vec2:
         return f'({self.x}, {self.y})'
 
     def __repr__(self)-> str:
-        return "Vec2" + self.__str__()
+        return f'Vec2({self.x}, {self.y})'
 
     def __len__(self) -> int:
         return 2
@@ -198,7 +204,8 @@ cdef class Vec2:
     reversed = __neg__
 
     def __bool__(self) -> bool:
-        return self.x != 0 or self.y != 0
+        # inlined "not self.is_null", tested to match for NaN and ABS_TOL
+        return not (fabs(self.x) <= ABS_TOL and fabs(self.y) <= ABS_TOL)
 
     def isclose(self, other: UVec, *, double rel_tol=REL_TOL,
                 double abs_tol = ABS_TOL) -> bool:
@@ -207,9 +214,8 @@ cdef class Vec2:
                isclose(self.y, o.y, rel_tol, abs_tol)
 
     def __eq__(self, other: UVec) -> bool:
-        if not isinstance(other, Vec2):
-            other = Vec2(other)
-        return self.x == other.x and self.y == other.y
+        cdef Vec2 o = other if isinstance(other, Vec2) else Vec2(other)
+        return self.x == o.x and self.y == o.y
 
     def __lt__(self, other) -> bool:
         cdef Vec2 o = Vec2(other)
@@ -274,9 +280,12 @@ cdef class Vec2:
         return v2_angle_between(self, o)
 
     def rotate(self, double angle) -> Vec2:
-        cdef double self_angle = atan2(self.y, self.x)
-        cdef double magnitude = hypot(self.x, self.y)
-        return v2_from_angle(self_angle + angle, magnitude)
+        cdef double c = cos(angle)
+        cdef double s = sin(angle)
+        cdef Vec2 res = Vec2()
+        res.x = self.x * c - self.y * s
+        res.y = self.x * s + self.y * c
+        return res
 
     def rotate_deg(self, double angle) -> Vec2:
         return self.rotate(angle * DEG2RAD)
@@ -294,6 +303,27 @@ cdef class Vec2:
         return res
 
 
+cdef bint is_vertex_array(items):
+    # numpy arrays of shape (n, 2) or (n, 3), iterating an array row by row
+    # and converting each row into a vector is very slow
+    return (
+        isinstance(items, np.ndarray)
+        and items.ndim == 2
+        and 1 < items.shape[1] < 4
+    )
+
+cdef list v2_list_from_array(items):
+    cdef const double[:, :] a = np.asarray(items, dtype=np.float64)
+    cdef Py_ssize_t i
+    cdef Vec2 v
+    cdef list res = []
+    for i in range(a.shape[0]):
+        v = Vec2()
+        v.x = a[i, 0]
+        v.y = a[i, 1]
+        res.append(v)
+    return res
+
 cdef Vec2 v2_add(Vec2 a, Vec2 b):
     res = Vec2()
     res.x = a.x + b.x
@@ -457,15 +487,20 @@ cdef class Vec3:
 
     @staticmethod
     def list(items: Iterable[UVec]) -> List[Vec3]:
+        if is_vertex_array(items):
+            return v3_list_from_array(items)
         return list(Vec3.generate(items))
 
     @staticmethod
     def tuple(items: Iterable[UVec]) -> Sequence[Vec3]:
+        if is_vertex_array(items):
+            return tuple(v3_list_from_array(items))
         return tuple(Vec3.generate(items))
 
     @staticmethod
     def generate(items: Iterable[UVec]) -> Iterator[Vec3]:
-        return (Vec3(item) for item in items)
+        # Vec3 instances are immutable, no copy required
+        return (item if type(item) is Vec3 else Vec3(item) for item in items)
 
     @staticmethod
     def from_angle(double angle, double length = 1.0) -> Vec3:
@@ -488,13 +523,13 @@ cdef class Vec3:
         return f'({self.x}, {self.y}, {self.z})'
 
     def __repr__(self)-> str:
-        return "Vec3" + self.__str__()
+        return f'Vec3({self.x}, {self.y}, {self.z})'
 
     def __len__(self) -> int:
         return 3
 
     def __hash__(self) -> int:
-        return hash(self.xyz)
+        return hash((self.x, self.y, self.z))
 
     def copy(self) -> Vec3:
         return self  # immutable
@@ -587,7 +622,9 @@ cdef class Vec3:
         return v3_reverse(self)
 
     def __bool__(self) -> bool:
-        return not self.is_null
+        # inlined "not self.is_null", tested to match for NaN and ABS_TOL
+        return not (fabs(self.x) <= ABS_TOL and fabs(self.y) <= ABS_TOL and
+                    fabs(self.z) <= ABS_TOL)
 
     def isclose(self, other: UVec, *, double rel_tol = REL_TOL,
                 double abs_tol = ABS_TOL) -> bool:
@@ -596,9 +633,8 @@ cdef class Vec3:
         return v3_isclose(self, <Vec3> other, rel_tol, abs_tol)
 
     def __eq__(self, other: UVec) -> bool:
-        if not isinstance(other, Vec3):
-            other = Vec3(other)
-        return self.x == other.x and self.y == other.y and self.z == other.z
+        cdef Vec3 o = other if isinstance(other, Vec3) else Vec3(other)
+        return self.x == o.x and self.y == o.y and self.z == o.z
 
     def __lt__(self, other: UVec) -> bool:
         if not isinstance(other, Vec3):
@@ -659,8 +695,14 @@ cdef class Vec3:
     def sum(items: Iterable[UVec]) -> Vec3:
         cdef Vec3 res = Vec3()
         cdef Vec3 tmp
+        if is_vertex_array(items):
+            return v3_sum_array(items)
         for v in items:
-            tmp = Vec3(v)
+            # Vec3 instances are immutable, no copy required
+            if isinstance(v, Vec3):
+                tmp = <Vec3> v
+            else:
+                tmp = Vec3(v)
             res.x += tmp.x
             res.y += tmp.y
             res.z += tmp.z
@@ -688,9 +730,11 @@ cdef class Vec3:
         return v3_angle_about(self, b, t)
 
     def rotate(self, double angle) -> Vec3:
-        cdef double angle_ = atan2(self.y, self.x) + angle
-        cdef double magnitude_ = hypot(self.x, self.y)
-        cdef Vec3 res = Vec3.from_angle(angle_, magnitude_)
+        cdef double c = cos(angle)
+        cdef double s = sin(angle)
+        cdef Vec3 res = Vec3()
+        res.x = self.x * c - self.y * s
+        res.y = self.x * s + self.y * c
         res.z = self.z
         return res
 
@@ -703,6 +747,33 @@ Y_AXIS = Vec3(0, 1, 0)
 Z_AXIS = Vec3(0, 0, 1)
 NULLVEC = Vec3(0, 0, 0)
 
+cdef list v3_list_from_array(items):
+    cdef const double[:, :] a = np.asarray(items, dtype=np.float64)
+    cdef Py_ssize_t i
+    cdef bint has_z = a.shape[1] > 2
+    cdef Vec3 v
+    cdef list res = []
+    for i in range(a.shape[0]):
+        v = Vec3()
+        v.x = a[i, 0]
+        v.y = a[i, 1]
+        if has_z:
+            v.z = a[i, 2]
+        res.append(v)
+    return res
+
+cdef Vec3 v3_sum_array(items):
+    cdef const double[:, :] a = np.asarray(items, dtype=np.float64)
+    cdef Py_ssize_t i
+    cdef Vec3 res = Vec3()
+    for i in range(a.shape[0]):
+        res.x += a[i, 0]
+        res.y += a[i, 1]
+    if a.shape[1] > 2:
+        for i in range(a.shape[0]):
+            res.z += a[i, 2]
+    return res
+
 cdef Vec3 v3_add(Vec3 a, Vec3 b):
     res = Vec3()
     res.x = a.x + b.x
@@ -769,7 +840,7 @@ cdef Vec3 v3_from_angle(double angle, double length):
 
 
 cdef double v3_angle_between(Vec3 a, Vec3 b) except -1000:
-    cdef double cos_theta = v3_dot(v3_normalize(a, 1.0), v3_normalize(b, 1.0))
+    cdef double cos_theta = v3_dot(a, b) / (v3_magnitude(a) * v3_magnitude(b))
     # avoid domain errors caused by floating point imprecision:
     if cos_theta < -1.0:
         cos_theta = -1.0
@@ -2,7 +2,6 @@
 #  License: MIT License
 from __future__ import annotations
 from typing import (
-    NamedTuple,
     Any,
     Sequence,
     Iterator,
@@ -17,6 +16,7 @@ from typing import (
 from typing_extensions import TypeAlias
 import math
 import struct
+import sys
 from datetime import datetime
 
 from ezdxf.math import Vec3
@@ -35,11 +35,41 @@ if TYPE_CHECKING:
     from .entities import AcisEntity
 
 
-class Token(NamedTuple):
-    """Named tuple to store tagged value tokens of the SAB format."""
+class Token:
+    """Tagged value token of the SAB format.
 
-    tag: int
-    value: Any
+    A slotted class requires less memory than a named tuple and is faster to
+    create, a SAB file can contain millions of tokens. Tokens still compare
+    equal to, index and unpack like ``(tag, value)`` tuples.
+
+    Tokens are mutable, :func:`resolve_pointers` replaces the value of pointer
+    tokens in place, and therefore not hashable.
+    """
+
+    __slots__ = ("tag", "value")
+
+    def __init__(self, tag: int, value: Any):
+        self.tag = tag
+        self.value = value
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter((self.tag, self.value))
+
+    def __getitem__(self, index):
+        return (self.tag, self.value)[index]
+
+    def __len__(self) -> int:
+        return 2
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Token):
+            return self.tag == other.tag and self.value == other.value
+        return (self.tag, self.value) == other
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self):
+        return f"Token(tag={self.tag!r}, value={self.value!r})"
 
     def __str__(self):
         return f"(0x{self.tag:02x}, {str(self.value)})"
@@ -47,11 +77,44 @@ class Token(NamedTuple):
 
 SabRecord: TypeAlias = List[Token]
 
+# Tag values as plain int constants for the decoder loop:
+_INT = int(Tags.INT)
+_DOUBLE = int(Tags.DOUBLE)
+_STR = int(Tags.STR)
+_BOOL_TRUE = int(Tags.BOOL_TRUE)
+_BOOL_FALSE = int(Tags.BOOL_FALSE)
+_POINTER = int(Tags.POINTER)
+_ENTITY_TYPE = int(Tags.ENTITY_TYPE)
+_ENTITY_TYPE_EX = int(Tags.ENTITY_TYPE_EX)
+_SUBTYPE_START = int(Tags.SUBTYPE_START)
+_SUBTYPE_END = int(Tags.SUBTYPE_END)
+_RECORD_END = int(Tags.RECORD_END)
+_LITERAL_STR = int(Tags.LITERAL_STR)
+_LOCATION_VEC = int(Tags.LOCATION_VEC)
+_DIRECTION_VEC = int(Tags.DIRECTION_VEC)
+_ENUM = int(Tags.ENUM)
+_UNKNOWN_0x17 = int(Tags.UNKNOWN_0x17)
+
+# Precompiled (un)pack functions, struct.pack() and struct.unpack_from() parse
+# the format string at each call:
+_unpack_int = struct.Struct("<i").unpack_from
+_unpack_double = struct.Struct("<d").unpack_from
+_unpack_vec3 = struct.Struct("<3d").unpack_from
+_pack_tag_int = struct.Struct("<Bi").pack
+_pack_tag_double = struct.Struct("<Bd").pack
+_pack_tag_vec3 = struct.Struct("<B3d").pack
+_pack_tag_byte = struct.Struct("<BB").pack
+
 
 class Decoder:
-    def __init__(self, data: bytes):
-        self.data = data
+    def __init__(self, data: Union[bytes, bytearray]):
+        # bytes(data) returns the same object for bytes and copies a bytearray only
+        # once, the decoder loop relies on hashable slices of immutable bytes
+        self.data: bytes = bytes(data)
         self.index: int = 0
+        # Entity type names recur in each record, the raw bytes of the type tags
+        # are mapped to the decoded and interned names:
+        self._entity_types: dict[bytes, str] = {}
 
     @property
     def has_data(self) -> bool:
@@ -94,15 +157,16 @@ class Decoder:
 
     def read_int(self) -> int:
         pos = self.forward(4)
-        values = struct.unpack_from("<i", self.data, pos)[0]
-        return values
+        return _unpack_int(self.data, pos)[0]
 
     def read_float(self) -> float:
         pos = self.forward(8)
-        return struct.unpack_from("<d", self.data, pos)[0]
+        return _unpack_double(self.data, pos)[0]
 
     def read_floats(self, count: int) -> Sequence[float]:
         pos = self.forward(8 * count)
+        if count == 3:
+            return _unpack_vec3(self.data, pos)
         return struct.unpack_from(f"<{count}d", self.data, pos)
 
     def read_str(self, length) -> str:
@@ -122,57 +186,94 @@ class Decoder:
         return self.read_float()
 
     def read_record(self) -> SabRecord:
-        def entity_name():
-            return "-".join(entity_type)
-
+        # This is the hot loop of the SAB parser: all values are decoded inline by a
+        # single pass over the data, the index is stored as local variable and written
+        # back at the end of the record. The overhead of the read_xxx() method calls
+        # was greater than the actual decoding work.
+        data = self.data
+        size = len(data)
+        index = self.index
+        unpack_int = _unpack_int
+        unpack_double = _unpack_double
+        unpack_vec3 = _unpack_vec3
+        entity_types = self._entity_types
         values: SabRecord = []
-        entity_type: list[str] = []
+        type_start: int = -1  # start index of a multipart entity type
         subtype_level: int = 0
         while True:
-            if not self.has_data:
+            if index >= size:
+                self.index = index
                 if values:
                     token = values[0]
                     if token.value in const.DATA_END_MARKERS:
                         return values
                 raise ParsingError("pre-mature end of data")
-            tag = self.read_byte()
-            if tag == Tags.INT:
-                values.append(Token(tag, self.read_int()))
-            elif tag == Tags.DOUBLE:
-                values.append(Token(tag, self.read_float()))
-            elif tag == Tags.STR:
-                values.append(Token(tag, self.read_str(self.read_byte())))
-            elif tag == Tags.POINTER:
-                values.append(Token(tag, self.read_int()))
-            elif tag == Tags.BOOL_TRUE:
-                values.append(Token(tag, True))
-            elif tag == Tags.BOOL_FALSE:
+            tag = data[index]
+            index += 1
+            # Compare plain int constants, the attribute lookup of the IntEnum members
+            # is more expensive than the comparison itself. The branches are ordered
+            # by the frequency of the tags in real SAB data.
+            if tag == _POINTER:
+                values.append(Token(tag, unpack_int(data, index)[0]))
+                index += 4
+            elif tag == _INT:
+                values.append(Token(tag, unpack_int(data, index)[0]))
+                index += 4
+            elif tag == _BOOL_FALSE:
                 values.append(Token(tag, False))
-            elif tag == Tags.LITERAL_STR:
-                values.append(Token(tag, self.read_str(self.read_int())))
-            elif tag == Tags.ENTITY_TYPE_EX:
-                entity_type.append(self.read_str(self.read_byte()))
-            elif tag == Tags.ENTITY_TYPE:
-                entity_type.append(self.read_str(self.read_byte()))
-                values.append(Token(tag, entity_name()))
-                entity_type.clear()
-            elif tag == Tags.LOCATION_VEC:
-                values.append(Token(tag, self.read_floats(3)))
-            elif tag == Tags.DIRECTION_VEC:
-                values.append(Token(tag, self.read_floats(3)))
-            elif tag == Tags.ENUM:
-                values.append(Token(tag, self.read_int()))
-            elif tag == Tags.UNKNOWN_0x17:
-                values.append(Token(tag, self.read_float()))
-            elif tag == Tags.SUBTYPE_START:
+            elif tag == _ENTITY_TYPE:
+                if type_start == -1:
+                    type_start = index - 1
+                index += data[index] + 1
+                raw_type = data[type_start:index]
+                name = entity_types.get(raw_type)
+                if name is None:
+                    name = sys.intern(decode_entity_type(raw_type))
+                    entity_types[raw_type] = name
+                values.append(Token(tag, name))
+                type_start = -1
+            elif tag == _RECORD_END:
+                self.index = index
+                return values
+            elif tag == _DIRECTION_VEC:
+                values.append(Token(tag, unpack_vec3(data, index)))
+                index += 24
+            elif tag == _LOCATION_VEC:
+                values.append(Token(tag, unpack_vec3(data, index)))
+                index += 24
+            elif tag == _DOUBLE:
+                values.append(Token(tag, unpack_double(data, index)[0]))
+                index += 8
+            elif tag == _STR:
+                length = data[index]
+                index += 1
+                values.append(Token(tag, data[index : index + length].decode()))
+                index += length
+            elif tag == _BOOL_TRUE:
+                values.append(Token(tag, True))
+            elif tag == _ENTITY_TYPE_EX:
+                if type_start == -1:
+                    type_start = index - 1
+                index += data[index] + 1
+            elif tag == _LITERAL_STR:
+                length = unpack_int(data, index)[0]
+                index += 4
+                values.append(Token(tag, data[index : index + length].decode()))
+                index += length
+            elif tag == _ENUM:
+                values.append(Token(tag, unpack_int(data, index)[0]))
+                index += 4
+            elif tag == _UNKNOWN_0x17:
+                values.append(Token(tag, unpack_double(data, index)[0]))
+                index += 8
+            elif tag == _SUBTYPE_START:
                 subtype_level += 1
                 values.append(Token(tag, subtype_level))
-            elif tag == Tags.SUBTYPE_END:
+            elif tag == _SUBTYPE_END:
                 values.append(Token(tag, subtype_level))
                 subtype_level -= 1
-            elif tag == Tags.RECORD_END:
-                return values
             else:
+                self.index = index
                 raise ParsingError(
                     f"unknown SAB tag: 0x{tag:x} ({tag}) in entity '{values[0].value}'"
                 )
@@ -188,6 +289,20 @@ class Decoder:
                 return
 
 
+def decode_entity_type(data: bytes) -> str:
+    """Returns the entity type name of the raw bytes of the ENTITY_TYPE_EX tags
+    followed by the terminating ENTITY_TYPE tag.
+    """
+    parts: list[str] = []
+    index = 0
+    while index < len(data):
+        length = data[index + 1]
+        index += 2
+        parts.append(data[index : index + length].decode())
+        index += length
+    return "-".join(parts)
+
+
 class SabEntity(AbstractEntity):
     """Low level representation of an ACIS entity (node)."""
 
@@ -349,17 +464,16 @@ def build_entities(
 
 
 def resolve_pointers(entities: list[SabEntity]) -> list[SabEntity]:
-    def ptr(num: int) -> SabEntity:
-        if num == -1:
-            return NULL_PTR
-        return entities[num]
-
+    # The NULL_PTR is appended as last item, so the pointer value -1 resolves
+    # to the NULL_PTR by the same list lookup as all other pointers:
+    targets = list(entities)
+    targets.append(NULL_PTR)
     for entity in entities:
-        entity.attributes = ptr(entity.attr_ptr)
+        entity.attributes = targets[entity.attr_ptr]
         entity.attr_ptr = -1
-        for index, token in enumerate(entity.data):
-            if token.tag == Tags.POINTER:
-                entity.data[index] = Token(token.tag, ptr(token.value))
+        for token in entity.data:
+            if token.tag == _POINTER:
+                token.value = targets[token.value]
     return entities
 
 
@@ -445,28 +559,30 @@ def encode_entity_type(name: str) -> list[Token]:
     return tokens
 
 
-def encode_entity_ptr(entity: SabEntity, entities: list[SabEntity]) -> Token:
+def encode_entity_ptr(entity: SabEntity, indices: dict[SabEntity, int]) -> Token:
     if entity.is_null_ptr:
         return Token(Tags.POINTER, -1)
     try:
-        return Token(Tags.POINTER, entities.index(entity))
-    except ValueError:
+        return Token(Tags.POINTER, indices[entity])
+    except KeyError:
         raise InvalidLinkStructure(
             f"entity {str(entity)} not in record storage"
         )
 
 
 def build_sab_records(entities: list[SabEntity]) -> Iterator[SabRecord]:
+    # record index of each entity, a linear search for each pointer is O(n²)
+    indices = {entity: index for index, entity in enumerate(entities)}
     for entity in entities:
         record: list[Token] = []
         record.extend(encode_entity_type(entity.name))
         # 1. attribute record pointer
-        record.append(encode_entity_ptr(entity.attributes, entities))
+        record.append(encode_entity_ptr(entity.attributes, indices))
         # 2. int id
         record.append(Token(Tags.INT, entity.id))
         for token in entity.data:
             if token.tag == Tags.POINTER:
-                record.append(encode_entity_ptr(token.value, entities))
+                record.append(encode_entity_ptr(token.value, indices))
             elif token.tag == Tags.ENTITY_TYPE:
                 record.extend(encode_entity_type(token.value))
             else:
@@ -493,35 +609,32 @@ class Encoder:
 
     def write_token(self, token: Token) -> None:
         tag = token.tag
-        if tag in (Tags.INT, Tags.POINTER, Tags.ENUM):
+        append = self.buffer.append
+        if tag == _POINTER or tag == _INT or tag == _ENUM:
             assert isinstance(token.value, int)
-            self.buffer.append(struct.pack("<Bi", tag, token.value))
-        elif tag == Tags.DOUBLE:
+            append(_pack_tag_int(tag, token.value))
+        elif tag == _DIRECTION_VEC or tag == _LOCATION_VEC:
+            v = token.value
+            assert isinstance(v, Vec3)
+            append(_pack_tag_vec3(tag, v.x, v.y, v.z))
+        elif tag == _DOUBLE:
             assert isinstance(token.value, float)
-            self.buffer.append(struct.pack("<Bd", tag, token.value))
-        elif tag == Tags.STR:
+            append(_pack_tag_double(tag, token.value))
+        elif tag == _STR or tag == _ENTITY_TYPE or tag == _ENTITY_TYPE_EX:
             assert isinstance(token.value, str)
             data = token.value.encode(encoding=SAB_ENCODING)
-            self.buffer.append(struct.pack("<BB", tag, len(data)) + data)
-        elif tag == Tags.LITERAL_STR:
+            append(_pack_tag_byte(tag, len(data)) + data)
+        elif tag == _LITERAL_STR:
             assert isinstance(token.value, str)
             data = token.value.encode(encoding=SAB_ENCODING)
-            self.buffer.append(struct.pack("<Bi", tag, len(data)) + data)
-        elif tag in (Tags.ENTITY_TYPE, Tags.ENTITY_TYPE_EX):
-            assert isinstance(token.value, str)
-            data = token.value.encode(encoding=SAB_ENCODING)
-            self.buffer.append(struct.pack("<BB", tag, len(data)) + data)
-        elif tag in (Tags.LOCATION_VEC, Tags.DIRECTION_VEC):
-            v = token.value
-            assert isinstance(v, Vec3)
-            self.buffer.append(struct.pack("<B3d", tag, v.x, v.y, v.z))
-        elif tag == Tags.BOOL_TRUE:
-            self.buffer.append(TRUE_RECORD)
-        elif tag == Tags.BOOL_FALSE:
-            self.buffer.append(FALSE_RECORD)
-        elif tag == Tags.SUBTYPE_START:
-            self.buffer.append(SUBTYPE_START_RECORD)
-        elif tag == Tags.SUBTYPE_END:
-            self.buffer.append(SUBTYPE_END_RECORD)
+            append(_pack_tag_int(tag, len(data)) + data)
+        elif tag == _BOOL_TRUE:
+            append(TRUE_RECORD)
+        elif tag == _BOOL_FALSE:
+            append(FALSE_RECORD)
+        elif tag == _SUBTYPE_START:
+            append(SUBTYPE_START_RECORD)
+        elif tag == _SUBTYPE_END:
+            append(SUBTYPE_END_RECORD)
         else:
             raise ValueError(f"invalid tag in token: {token}")
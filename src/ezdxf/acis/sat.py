@@ -234,10 +234,12 @@ def build_str_records(entities: list[SatEntity], version: int) -> Iterator[str]:
         if e is NULL_PTR:
             return "$-1"
         try:
-            return f"${entities.index(e)}"
-        except ValueError:
+            return f"${indices[e]}"
+        except KeyError:
             raise InvalidLinkStructure(f"entity {str(e)} not in record storage")
 
+    # record index of each entity, a linear search for each pointer is O(n²)
+    indices = {entity: index for index, entity in enumerate(entities)}
     for entity in entities:
         tokens = [entity.name]
         tokens.append(ptr_str(entity.attributes))
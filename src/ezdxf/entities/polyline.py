@@ -796,6 +796,9 @@ class PolyfaceBuilder:
         self.faces: list[DXFVertex] = []
         self.vertices: list[DXFVertex] = []
         self.index_mapping: dict[tuple[float, ...], int] = {}
+        # POLYFACE vertices are shared by multiple faces, the rounded key of
+        # each processed vertex is calculated only once: id(vertex) -> index
+        self.vertex_cache: dict[int, int] = {}
         self.build(faces)
 
     @property
@@ -822,17 +825,20 @@ class PolyfaceBuilder:
             self.faces.append(face_record)
 
     def add(self, vertex: DXFVertex) -> int:
-        def key(point):
-            return tuple((round(coord, self.precision) for coord in point))
-
-        location = key(vertex.dxf.location)
+        vertex_id = id(vertex)
         try:
-            return self.index_mapping[location]
+            return self.vertex_cache[vertex_id]
         except KeyError:
+            pass
+        precision = self.precision
+        location = tuple(round(coord, precision) for coord in vertex.dxf.location)
+        index = self.index_mapping.get(location)
+        if index is None:
             index = len(self.vertices)
             self.index_mapping[location] = index
             self.vertices.append(vertex)
-            return index
+        self.vertex_cache[vertex_id] = index
+        return index
 
 
 class Polymesh(Polyline):
@@ -214,9 +214,13 @@ class Evaluator:
         p = basis.degree
         span = basis.find_span(u)
         N = basis.basis_funcs(span, u)
-        return Vec3.sum(
-            N[i] * control_points[span - p + i] for i in range(p + 1)
-        )
+        x = y = z = 0.0
+        for i, factor in enumerate(N, span - p):
+            cpoint = control_points[i]
+            x += cpoint.x * factor
+            y += cpoint.y * factor
+            z += cpoint.z * factor
+        return Vec3(x, y, z)
 
     def points(self, t: Iterable[float]) -> Iterable[Vec3]:
         for u in t:
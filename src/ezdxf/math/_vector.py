@@ -12,6 +12,7 @@ from typing import (
 from functools import partial
 import math
 import random
+import numpy as np
 
 if TYPE_CHECKING:
     from ezdxf.math import UVec, AnyVec
@@ -22,6 +23,23 @@ isclose = partial(math.isclose, abs_tol=ABS_TOL)
 __all__ = ["Vec3", "Vec2"]
 
 
+def _is_vertex_array(items) -> bool:
+    # numpy arrays of shape (n, 2) or (n, 3): converting the rows of the array
+    # is much slower than converting the nested lists of floats
+    return (
+        isinstance(items, np.ndarray)
+        and items.ndim == 2
+        and 1 < items.shape[1] < 4
+    )
+
+
+def _xyz(other) -> Tuple[float, float, float]:
+    # fast path of Vec3.decompose() for the most common argument type
+    if other.__class__ is Vec3:
+        return other._x, other._y, other._z
+    return Vec3.decompose(other)
+
+
 class Vec3:
     """Immutable 3D vector class.
 
@@ -70,7 +88,20 @@ class Vec3:
     __slots__ = ["_x", "_y", "_z"]
 
     def __init__(self, *args):
-        self._x, self._y, self._z = self.decompose(*args)
+        # inlined fast paths of decompose() for the most common arguments
+        count = len(args)
+        if count == 3:
+            x, y, z = args
+            self._x = float(x)
+            self._y = float(y)
+            self._z = float(z)
+        elif count == 1 and isinstance(args[0], Vec3):
+            v = args[0]
+            self._x = v._x
+            self._y = v._y
+            self._z = v._z
+        else:
+            self._x, self._y, self._z = self.decompose(*args)
 
     @property
     def x(self) -> float:
@@ -141,7 +172,10 @@ class Vec3:
     @classmethod
     def generate(cls, items: Iterable[UVec]) -> Iterator[Vec3]:
         """Returns an iterable of :class:`Vec3` objects."""
-        return (cls(item) for item in items)
+        if _is_vertex_array(items):
+            items = items.tolist()  # type: ignore
+        # immutable instances of the same class are reused, no copy required
+        return (item if item.__class__ is cls else cls(item) for item in items)
 
     @classmethod
     def from_angle(cls, angle: float, length: float = 1.0) -> Vec3:
@@ -210,11 +244,11 @@ class Vec3:
 
     def __str__(self) -> str:
         """Return ``'(x, y, z)'`` as string."""
-        return "({0.x}, {0.y}, {0.z})".format(self)
+        return f"({self._x}, {self._y}, {self._z})"
 
     def __repr__(self) -> str:
         """Return ``'Vec3(x, y, z)'`` as string."""
-        return "Vec3" + self.__str__()
+        return f"Vec3({self._x}, {self._y}, {self._z})"
 
     def __len__(self) -> int:
         """Returns always ``3``."""
@@ -224,7 +258,7 @@ class Vec3:
         """Returns hash value of vector, enables the usage of vector as key in
         ``set`` and ``dict``.
         """
-        return hash(self.xyz)
+        return hash((self._x, self._y, self._z))
 
     def copy(self) -> Vec3:
         """Returns a copy of vector as :class:`Vec3` object."""
@@ -268,7 +302,8 @@ class Vec3:
     @property
     def magnitude(self) -> float:
         """Length of vector."""
-        return self.magnitude_square**0.5
+        x, y, z = self._x, self._y, self._z
+        return math.sqrt(x * x + y * y + z * z)
 
     @property
     def magnitude_xy(self) -> float:
@@ -354,7 +389,9 @@ class Vec3:
 
     def normalize(self, length: float = 1.0) -> Vec3:
         """Returns normalized vector, optional scaled by `length`."""
-        return self.__mul__(length / self.magnitude)
+        x, y, z = self._x, self._y, self._z
+        factor = length / math.sqrt(x * x + y * y + z * z)
+        return self.__class__(x * factor, y * factor, z * factor)
 
     def reversed(self) -> Vec3:
         """Returns negated vector (-`self`)."""
@@ -364,7 +401,12 @@ class Vec3:
 
     def __bool__(self) -> bool:
         """Returns ``True`` if vector is not (0, 0, 0)."""
-        return not self.is_null
+        # inlined "not self.is_null", tested to match for NaN and ABS_TOL
+        return not (
+            abs(self._x) <= ABS_TOL
+            and abs(self._y) <= ABS_TOL
+            and abs(self._z) <= ABS_TOL
+        )
 
     def isclose(
         self, other: UVec, *, rel_tol: float = 1e-9, abs_tol: float = 1e-12
@@ -376,7 +418,7 @@ class Vec3:
         `PEP 485 <https://www.python.org/dev/peps/pep-0485/>`_.
 
         """
-        x, y, z = self.decompose(other)
+        x, y, z = _xyz(other)
         return (
             math.isclose(self._x, x, rel_tol=rel_tol, abs_tol=abs_tol)
             and math.isclose(self._y, y, rel_tol=rel_tol, abs_tol=abs_tol)
@@ -389,9 +431,8 @@ class Vec3:
         Args:
             other: :class:`Vec3` compatible object
         """
-        if not isinstance(other, Vec3):
-            other = Vec3(other)
-        return self.x == other.x and self.y == other.y and self.z == other.z
+        x, y, z = _xyz(other)
+        return self._x == x and self._y == y and self._z == z
 
     def __lt__(self, other: UVec) -> bool:
         """Lower than operator.
@@ -400,7 +441,7 @@ class Vec3:
             other: :class:`Vec3` compatible object
 
         """
-        x, y, z = self.decompose(other)
+        x, y, z = _xyz(other)
         if self._x == x:
             if self._y == y:
                 return self._z < z
@@ -411,7 +452,7 @@ class Vec3:
 
     def __add__(self, other: UVec) -> Vec3:
         """Add :class:`Vec3` operator: `self` + `other`."""
-        x, y, z = self.decompose(other)
+        x, y, z = _xyz(other)
         return self.__class__(self._x + x, self._y + y, self._z + z)
 
     def __radd__(self, other: UVec) -> Vec3:
@@ -421,12 +462,12 @@ class Vec3:
     def __sub__(self, other: UVec) -> Vec3:
         """Sub :class:`Vec3` operator: `self` - `other`."""
 
-        x, y, z = self.decompose(other)
+        x, y, z = _xyz(other)
         return self.__class__(self._x - x, self._y - y, self._z - z)
 
     def __rsub__(self, other: UVec) -> Vec3:
         """RSub :class:`Vec3` operator: `other` - `self`."""
-        x, y, z = self.decompose(other)
+        x, y, z = _xyz(other)
         return self.__class__(x - self._x, y - self._y, z - self._z)
 
     def __mul__(self, other: float) -> Vec3:
@@ -446,10 +487,16 @@ class Vec3:
     @staticmethod
     def sum(items: Iterable[UVec]) -> Vec3:
         """Add all vectors in `items`."""
-        s = NULLVEC
+        if _is_vertex_array(items):
+            return Vec3(*items.sum(axis=0))  # type: ignore
+        # accumulate floats, adding vectors creates a new Vec3 for each item
+        sx = sy = sz = 0.0
         for v in items:
-            s += v
-        return s
+            x, y, z = _xyz(v)
+            sx += x
+            sy += y
+            sz += z
+        return Vec3(sx, sy, sz)
 
     def dot(self, other: UVec) -> float:
         """Dot operator: `self` . `other`
@@ -457,7 +504,7 @@ class Vec3:
         Args:
             other: :class:`Vec3` compatible object
         """
-        x, y, z = self.decompose(other)
+        x, y, z = _xyz(other)
         return self._x * x + self._y * y + self._z * z
 
     def cross(self, other: UVec) -> Vec3:
@@ -466,7 +513,7 @@ class Vec3:
         Args:
             other: :class:`Vec3` compatible object
         """
-        x, y, z = self.decompose(other)
+        x, y, z = _xyz(other)
         return self.__class__(
             self._y * z - self._z * y,
             self._z * x - self._x * z,
@@ -475,8 +522,11 @@ class Vec3:
 
     def distance(self, other: UVec) -> float:
         """Returns distance between `self` and `other` vector."""
-        v = self.__class__(other)
-        return v.__sub__(self).magnitude
+        x, y, z = _xyz(other)
+        dx = x - self._x
+        dy = y - self._y
+        dz = z - self._z
+        return math.sqrt(dx * dx + dy * dy + dz * dz)
 
     def angle_between(self, other: UVec) -> float:
         """Returns angle between `self` and `other` in radians. +angle is
@@ -486,7 +536,10 @@ class Vec3:
             other: :class:`Vec3` compatible object
 
         """
-        cos_theta = self.normalize().dot(self.__class__(other).normalize())
+        x, y, z = _xyz(other)
+        cos_theta = (self._x * x + self._y * y + self._z * z) / (
+            self.magnitude * math.sqrt(x * x + y * y + z * z)
+        )
         # avoid domain errors caused by floating point imprecision:
         if cos_theta < -1.0:
             cos_theta = -1.0
@@ -517,9 +570,11 @@ class Vec3:
             angle: angle in radians
 
         """
-        v = self.__class__(self.x, self.y, 0.0)
-        v = Vec3.from_angle(v.angle + angle, v.magnitude)
-        return self.__class__(v.x, v.y, self.z)
+        c = math.cos(angle)
+        s = math.sin(angle)
+        x = self._x
+        y = self._y
+        return self.__class__(x * c - y * s, x * s + y * c, self._z)
 
     def rotate_deg(self, angle: float) -> Vec3:
         """Returns vector rotated about `angle` around the z-axis.
@@ -610,7 +665,10 @@ class Vec2:
 
     @classmethod
     def generate(cls, items: Iterable[UVec]) -> Iterator[Vec2]:
-        return (cls(item) for item in items)
+        if _is_vertex_array(items):
+            items = items.tolist()  # type: ignore
+        # immutable instances of the same class are reused, no copy required
+        return (item if item.__class__ is cls else cls(item) for item in items)
 
     @classmethod
     def from_angle(cls, angle: float, length: float = 1.0) -> Vec2:
@@ -621,10 +679,10 @@ class Vec2:
         return cls.from_angle(math.radians(angle), length)
 
     def __str__(self) -> str:
-        return "({0.x}, {0.y})".format(self)
+        return f"({self.x}, {self.y})"
 
     def __repr__(self) -> str:
-        return "Vec2" + self.__str__()
+        return f"Vec2({self.x}, {self.y})"
 
     def __len__(self) -> int:
         return 2
@@ -721,7 +779,8 @@ class Vec2:
     __neg__ = reversed
 
     def __bool__(self) -> bool:
-        return not self.is_null
+        # inlined "not self.is_null", tested to match for NaN and ABS_TOL
+        return not (abs(self.x) <= ABS_TOL and abs(self.y) <= ABS_TOL)
 
     def isclose(
         self, other: AnyVec, *, rel_tol: float = 1e-9, abs_tol: float = 1e-12
@@ -801,7 +860,11 @@ class Vec2:
             angle: angle in radians
 
         """
-        return self.__class__.from_angle(self.angle + angle, self.magnitude)
+        c = math.cos(angle)
+        s = math.sin(angle)
+        x = self.x
+        y = self.y
+        return self.__class__(x * c - y * s, x * s + y * c)
 
     def rotate_deg(self, angle: float) -> Vec2:
         """Rotate vector around origin.
@@ -819,7 +882,11 @@ class Vec2:
     @staticmethod
     def sum(items: Iterable[Vec2]) -> Vec2:
         """Add all vectors in `items`."""
-        s = Vec2(0, 0)
-        for v in items:
-            s += v
-        return s
+        sx = sy = 0.0
+        try:
+            for v in items:
+                sx += v.x
+                sy += v.y
+        except AttributeError:
+            raise TypeError("invalid argument")
+        return Vec2(sx, sy)
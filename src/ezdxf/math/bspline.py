@@ -874,7 +874,7 @@ class BSpline:
 
     """
 
-    __slots__ = ("_control_points", "_basis", "_clamped")
+    __slots__ = ("_control_points", "_basis", "_clamped", "_evaluator")
 
     def __init__(
         self,
@@ -903,7 +903,10 @@ class BSpline:
             if knots[0] != 0.0:
                 knots = normalize_knots(knots)
         self._basis = Basis(knots, order, count, weights=weights)
-        self._clamped = len(set(knots[:order])) == 1 and len(set(knots[-order:])) == 1
+        # knot values are non-decreasing, comparing the first and the last of
+        # the repetitive knot values at the start and the end is sufficient:
+        self._clamped = knots[0] == knots[order - 1] and knots[-1] == knots[-order]
+        self._evaluator: Optional[Evaluator] = None
 
     def __str__(self):
         return (
@@ -939,7 +942,12 @@ class BSpline:
 
     @property
     def evaluator(self) -> Evaluator:
-        return Evaluator(self._basis, self._control_points)
+        # BSpline is immutable, the evaluator can be reused:
+        evaluator = self._evaluator
+        if evaluator is None:
+            evaluator = Evaluator(self._basis, self._control_points)
+            self._evaluator = evaluator
+        return evaluator
 
     @property
     def is_rational(self):
@@ -1249,10 +1257,9 @@ class BSpline:
                     save = r - j
                     s = mult + j
                     for k in range(p, s - 1, -1):
-                        alpha = alphas[k - s]
-                        bezier_points[k] = bezier_points[k] * alpha + bezier_points[
-                            k - 1
-                        ] * (1.0 - alpha)
+                        bezier_points[k] = bezier_points[k - 1].lerp(
+                            bezier_points[k], alphas[k - s]
+                        )
                     if b < m:
                         next_bezier_points[save] = bezier_points[p]
             yield bezier_points
@@ -1319,15 +1326,20 @@ class BSpline:
             max_t = self.max_t
             params = [p * max_t for p in params]
         for _ in range(level - 1):
-            params = list(subdivide_params(params))
+            params = subdivide_params(params)
         return params
 
 
-def subdivide_params(p: list[float]) -> Iterable[float]:
-    for i in range(len(p) - 1):
-        yield p[i]
-        yield (p[i] + p[i + 1]) / 2.0
-    yield p[-1]
+def subdivide_params(p: list[float]) -> list[float]:
+    """Returns the parameters `p` with the mid-parameter of each parameter pair
+    inserted in between.
+
+    Returns a list, in previous versions this function was a generator.
+    """
+    result = [0.0] * (len(p) * 2 - 1)
+    result[0::2] = p
+    result[1::2] = [(t0 + t1) / 2.0 for t0, t1 in zip(p, p[1:])]
+    return result
 
 
 def open_uniform_bspline(
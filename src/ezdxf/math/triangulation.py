@@ -98,9 +98,19 @@ def mapbox_earcut_3d(
     if holes:
         holes_ocs = [list(ocs.points_from_wcs(hole)) for hole in holes]
 
+    # The earcut() function returns the input vertices as triangle vertices,
+    # transform each vertex only once back to WCS and not for each triangle:
+    ocs_vertices = list(exterior_ocs)
+    for hole in holes_ocs:
+        ocs_vertices.extend(hole)
+    wcs_vertices = dict(
+        zip(
+            map(id, ocs_vertices),
+            ocs.points_to_wcs(Vec3(v.x, v.y, elevation) for v in ocs_vertices),
+        )
+    )
+
     # Vec3 supports the _Point protocol in _mapbox_earcut.py
     # required attributes: x, y
-    for triangle in earcut(exterior_ocs, holes_ocs):
-        yield tuple(
-            ocs.points_to_wcs(Vec3(v.x, v.y, elevation) for v in triangle)
-        )
+    for a, b, c in earcut(exterior_ocs, holes_ocs):
+        yield wcs_vertices[id(a)], wcs_vertices[id(b)], wcs_vertices[id(c)]
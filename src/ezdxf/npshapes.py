@@ -101,13 +101,13 @@ class NumpyShape2d(abc.ABC):
         """Returns the shape vertices as list of :class:`Vec2` 
         e.g. [Vec2(1, 2), Vec2(3, 4), ...] 
         """
-        return [Vec2(v) for v in self._vertices]
+        return Vec2.list(self._vertices)
 
     def to_tuples(self) -> list[tuple[float, float]]:
         """Returns the shape vertices as list of 2-tuples 
         e.g. [(1, 2), (3, 4), ...]
         """
-        return [tuple(v) for v in self._vertices]
+        return [tuple(v) for v in self._vertices.tolist()]
     
     def to_list(self) -> list[list[float]]:
         """Returns the shape vertices as list of lists 
@@ -189,7 +189,7 @@ class NumpyPath2d(NumpyShape2d):
         return Vec2(self._vertices[-1])
 
     def control_vertices(self) -> list[Vec2]:
-        return [Vec2(v) for v in self._vertices]
+        return Vec2.list(self._vertices)
 
     def clone(self) -> Self:
         clone = self.__class__(None)
@@ -224,7 +224,7 @@ class NumpyPath2d(NumpyShape2d):
 
     def to_path(self) -> Path:
         """Returns a new :class:`ezdxf.path.Path` instance."""
-        vertices = [Vec3(v) for v in self._vertices]
+        vertices = Vec3.list(self._vertices)
         commands = [Command(c) for c in self._commands]
         return Path.from_vertices_and_commands(vertices, commands)
 
@@ -592,7 +592,7 @@ class NumpyShape3d(abc.ABC):
 
     def vertices(self) -> list[Vec3]:
         """Returns the shape vertices as list of :class:`Vec3`."""
-        return [Vec3(v) for v in self._vertices]
+        return Vec3.list(self._vertices)
 
     def bbox(self) -> BoundingBox:
         """Returns the bounding box of all vertices."""
@@ -87,6 +87,29 @@ def side_of_line(distance: float, abs_tol=1e-12) -> int:
     return -1
 
 
+def intersect_line(
+    a: Vec2, b: Vec2, dist_a: float, dist_b: float, line_distance: float
+) -> Intersection:
+    """Returns the :class:`Intersection` of the hatch line at the normal distance
+    `line_distance` and the line defined by the points `a` and `b`, see also
+    :meth:`HatchLine.intersect_line`.
+    """
+    # all distances are normal distances to the hatch baseline
+    side_a = side_of_line(dist_a - line_distance)
+    side_b = side_of_line(dist_b - line_distance)
+    if side_a == 0:
+        if side_b == 0:
+            return Intersection(IntersectionType.COLLINEAR, a, b)
+        else:
+            return Intersection(IntersectionType.START, a)
+    elif side_b == 0:
+        return Intersection(IntersectionType.END, b)
+    elif side_a != side_b:
+        factor = abs((dist_a - line_distance) / (dist_a - dist_b))
+        return Intersection(IntersectionType.REGULAR, a.lerp(b, factor))
+    return Intersection()  # no intersection
+
+
 @dataclasses.dataclass(frozen=True)
 class HatchLine:
     """Represents a single hatch line.
@@ -124,21 +147,7 @@ class HatchLine:
             dist_b: normal distance of point `b` to the hatch baseline as float
 
         """
-        # all distances are normal distances to the hatch baseline
-        line_distance = self.distance
-        side_a = side_of_line(dist_a - line_distance)
-        side_b = side_of_line(dist_b - line_distance)
-        if side_a == 0:
-            if side_b == 0:
-                return Intersection(IntersectionType.COLLINEAR, a, b)
-            else:
-                return Intersection(IntersectionType.START, a)
-        elif side_b == 0:
-            return Intersection(IntersectionType.END, b)
-        elif side_a != side_b:
-            factor = abs((dist_a - line_distance) / (dist_a - dist_b))
-            return Intersection(IntersectionType.REGULAR, a.lerp(b, factor))
-        return Intersection()  # no intersection
+        return intersect_line(a, b, dist_a, dist_b, self.distance)
 
     def intersect_cubic_bezier_curve(self, curve: Bezier4P) -> Sequence[Intersection]:
         """Returns 0 to 3 :class:`Intersection` points of this hatch line with
@@ -373,15 +382,17 @@ def intersect_polygon(
     for index in range(count):
         point = polygon[index]
         dist_point = baseline.signed_distance(point)
+        # The intersection of a line segment and a hatch line depends only on the
+        # normal distances, no need to create HatchLine() instances:
         for hatch_line_distance in hatch_line_distances(
             (dist_prev, dist_point), baseline.normal_distance
         ):
-            hatch_line = baseline.hatch_line(hatch_line_distance)
-            ip = hatch_line.intersect_line(
+            ip = intersect_line(
                 prev_point,
                 point,
                 dist_prev,
                 dist_point,
+                hatch_line_distance,
             )
             if (
                 ip.type != IntersectionType.NONE
@@ -459,8 +470,7 @@ def intersect_path(
             for hatch_line_distance in hatch_line_distances(
                 (dist_a, dist_b), baseline.normal_distance
             ):
-                hatch_line = baseline.hatch_line(hatch_line_distance)
-                ip = hatch_line.intersect_line(a, b, dist_a, dist_b)
+                ip = intersect_line(a, b, dist_a, dist_b, hatch_line_distance)
                 if (
                     ip.type != IntersectionType.NONE
                     and ip.type != IntersectionType.COLLINEAR
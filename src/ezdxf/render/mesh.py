@@ -1100,15 +1100,16 @@ class MeshVertexMerger(MeshBuilder):
         """
         indices = []
         precision = self.precision
+        ledger = self.ledger
+        mesh_vertices = self.vertices
         for vertex in Vec3.generate(vertices):
             key = vertex.round(precision)
-            try:
-                indices.append(self.ledger[key])
-            except KeyError:
-                index = len(self.vertices)
-                self.vertices.append(vertex)
-                self.ledger[key] = index
-                indices.append(index)
+            index = ledger.get(key)
+            if index is None:
+                index = len(mesh_vertices)
+                mesh_vertices.append(vertex)
+                ledger[key] = index
+            indices.append(index)
         return tuple(indices)
 
     def index(self, vertex: UVec) -> int:
@@ -1130,6 +1131,32 @@ class MeshVertexMerger(MeshBuilder):
         # rebuild from scratch to create a valid ledger
         return cls.from_mesh(other)
 
+    @classmethod
+    def from_polyface(cls, other: Union[Polymesh, Polyface]) -> MeshVertexMerger:
+        """Create new mesh from a  :class:`~ezdxf.entities.Polyface` or
+        :class:`~ezdxf.entities.Polymesh` object.
+
+        """
+        if other.dxftype() != "POLYLINE" or not other.is_poly_face_mesh:
+            return super().from_polyface(other)  # type: ignore
+
+        mesh = cls()
+        vertices, faces = other.indexed_faces()  # type: ignore
+        # Polyface vertices are shared by multiple faces, merge each polyface
+        # vertex only once: polyface vertex index -> mesh vertex index
+        index_map: dict[int, int] = {}
+        for face in faces:
+            indices = []
+            for polyface_index in face.indices:
+                index = index_map.get(polyface_index)
+                if index is None:
+                    location = vertices[polyface_index].dxf.location
+                    index = mesh.add_vertices((location,))[0]
+                    index_map[polyface_index] = index
+                indices.append(index)
+            mesh.faces.append(tuple(indices))
+        return mesh
+
 
 class MeshAverageVertexMerger(MeshBuilder):
     """Subclass of :class:`MeshBuilder`
@@ -659,16 +659,19 @@ def str2cells(
     # # ... tabulator
     if result is None:
         result = []
+    # the renderers are stateless, all cells of a kind can share one renderer
+    text_renderer = Rect("Text", result=result)
+    fraction_renderer = Rect("Fraction", result=result)
     for c in s.lower():
         if c == "t":
-            yield tl.Text(width=content, height=1, renderer=Rect("Text", result=result))
+            yield tl.Text(width=content, height=1, renderer=text_renderer)
         elif c == "f":
             cell = tl.Text(content / 2, 1)
             yield tl.Fraction(
                 top=cell,
                 bottom=cell,
                 stacking=tl.Stacking.SLANTED,
-                renderer=Rect("Fraction", result=result),
+                renderer=fraction_renderer,
             )
         elif c == " ":
             yield tl.Space(width=space)
@@ -729,33 +732,35 @@ class TestNormalizeCells:
         assert cells2str(cells) == content
 
     @pytest.mark.parametrize(
-        "content",
+        "content,expected",
         [
-            "t~ t",
-            "t ~t",
-            "t~~ t",
-            "t ~~t",
-            "~t",
-            "~~t",
-            "t#~t",
-            "t~#t",
-            "t~#~t",
+            ["t~ t", "t  t"],
+            ["t ~t", "t  t"],
+            ["t~~ t", "t   t"],
+            ["t ~~t", "t   t"],
+            ["~t", " t"],
+            ["~~t", "  t"],
+            ["t#~t", "t# t"],
+            ["t~#t", "t #t"],
+            ["t~#~t", "t # t"],
         ],
     )
-    def test_replace_useless_nbsp_by_spaces(self, content):
+    def test_replace_useless_nbsp_by_spaces(self, content, expected):
         cells = tl.normalize_cells(str2cells(content))
-        assert cells2str(cells) == content.replace("~", " ")
+        assert cells2str(cells) == expected
 
     @pytest.mark.parametrize("content", ["t t", "t  t", "t   t"])
     def test_preserve_multiple_spaces(self, content):
         cells = tl.normalize_cells(str2cells(content))
         assert cells2str(cells) == content
 
-    def test_remove_pending_glue(self):
-        for glue in permutations([" ", "~", " ", "#"]):
-            content = "t" + "".join(glue)
-            cells = list(tl.normalize_cells(str2cells(content)))
-            assert cells2str(cells) == "t"
+    # the two spaces create each permutation twice, test each one once
+    @pytest.mark.parametrize(
+        "glue", sorted({"".join(p) for p in permutations(" ~ #")})
+    )
+    def test_remove_pending_glue(self, glue):
+        cells = list(tl.normalize_cells(str2cells("t" + glue)))
+        assert cells2str(cells) == "t"
 
     @pytest.mark.parametrize("content", [" t", "  t", "   t"])
     def test_preserve_prepending_space(self, content):
@@ -28,6 +28,36 @@ def test_encode_header(cube_sab):
     assert data == cube_sab[:len(data)]
 
 
+class TestTokenProtocol:
+    def test_unpacking(self):
+        tag, value = sab.Token(T.INT, 7)
+        assert tag == T.INT
+        assert value == 7
+
+    def test_indexing_and_len(self):
+        token = sab.Token(T.INT, 7)
+        assert token[0] == T.INT
+        assert token[1] == 7
+        assert token[-1] == 7
+        assert len(token) == 2
+
+    def test_equality_with_tuples(self):
+        token = sab.Token(T.INT, 7)
+        assert token == (T.INT, 7)
+        assert token == sab.Token(T.INT, 7)
+        assert token != (T.INT, 8)
+
+    def test_str(self):
+        assert str(sab.Token(T.INT, 7)) == "(0x04, 7)"
+
+    def test_is_mutable_and_not_hashable(self):
+        token = sab.Token(T.INT, 7)
+        token.value = 8
+        assert token == (T.INT, 8)
+        with pytest.raises(TypeError):
+            hash(token)
+
+
 def test_decode_first_record(cube_sab):
     decoder = sab.Decoder(cube_sab)
     _ = decoder.read_header()
@@ -48,6 +78,21 @@ def test_decode_all_records(cube_sab):
     assert records[-1][0].value == "End-of-ASM-data"
 
 
+def test_decoded_entity_type_names_are_shared(cube_sab):
+    decoder = sab.Decoder(cube_sab)
+    _ = decoder.read_header()
+    names = [record[0].value for record in decoder.read_records()]
+    faces = [name for name in names if name == "face"]
+    assert len(faces) == 6
+    assert all(name is faces[0] for name in faces)
+    assert "plane-surface" in names
+
+
+def test_decode_multipart_entity_type():
+    data = bytes([T.ENTITY_TYPE_EX, 5]) + b"plane" + bytes([T.ENTITY_TYPE, 7])
+    assert sab.decode_entity_type(data + b"surface") == "plane-surface"
+
+
 def test_parse_sab(cube_sab):
     builder = sab.parse_sab(cube_sab)
     assert builder.header.version == 21800
@@ -3,6 +3,7 @@
 import pytest
 import math
 import pickle
+import numpy as np
 
 # Import from 'ezdxf.math._vector' to test Python implementation
 from ezdxf.math._vector import Vec3
@@ -85,6 +86,19 @@ def test_usage_as_tuple(vec3):
     assert v.xyz == (1, 2, 3)
 
 
+def test_list_from_numpy_array(vec3):
+    assert vec3.list(np.array([(1, 2, 3), (4, 5, 6)])) == [(1, 2, 3), (4, 5, 6)]
+    assert vec3.tuple(np.array([(1.5, 2), (4, 5)])) == ((1.5, 2, 0), (4, 5, 0))
+    assert vec3.list(np.empty((0, 3))) == []
+
+
+def test_list_reuses_immutable_instances(vec3):
+    v = vec3(1, 2, 3)
+    result = vec3.list([v, (4, 5, 6)])
+    assert result[0] is v
+    assert result[1] == (4, 5, 6)
+
+
 def test_get_item_positive_index(vec3):
     v = vec3(1, 2, 3)
     assert v[0] == 1
@@ -191,6 +205,22 @@ def test_bool(vec3):
     assert not vec3(1e-8, 0, 0).is_null
 
 
+def test_bool_nan(vec3):
+    v = vec3(math.nan, 0, 0)
+    assert v.is_null is False
+    assert bool(v) is True
+
+
+@pytest.mark.parametrize(
+    "x",
+    [0.0, -0.0, 1e-12, -1e-12, 1.1e-12, -1.1e-12, 1e-8, math.nan, math.inf],
+)
+def test_bool_is_not_null(x, vec3):
+    # __bool__() inlines the "is_null" test and must not deviate from it
+    for v in (vec3(x, 0, 0), vec3(0, x, 0), vec3(0, 0, x)):
+        assert bool(v) is (not v.is_null)
+
+
 def test_magnitude(vec3):
     v = vec3(3, 4, 5)
     assert math.isclose(abs(v), 7.0710678118654755)
@@ -477,6 +507,12 @@ def test_vec3_sum(vec3):
     assert vec3.sum([vec3(1, 1, 1), (2, 2, 2)]) == (3, 3, 3)
 
 
+def test_vec3_sum_numpy_array(vec3):
+    assert vec3.sum(np.array([(1, 1, 1), (2, 2, 2)])) == (3, 3, 3)
+    assert vec3.sum(np.array([(1, 1), (2, 2)])) == (3, 3, 0)
+    assert vec3.sum(np.empty((0, 3))).is_null is True
+
+
 def test_picklable(vec3):
     for v in [vec3(), vec3((1, 2.5, 3)), vec3(1, 2.5, 3)]:
         pickled_v = pickle.loads(pickle.dumps(v))
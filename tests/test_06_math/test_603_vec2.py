@@ -3,6 +3,7 @@
 import pytest
 import math
 import pickle
+import numpy as np
 
 # Import from 'ezdxf.math._vector' to test Python implementation
 from ezdxf.math._vector import Vec2, Vec3
@@ -79,6 +80,11 @@ def test_from_angle(vcls):
     )
 
 
+def test_list_from_numpy_array(vec2):
+    assert vec2.list(np.array([(1, 2), (4, 5)])) == [(1, 2), (4, 5)]
+    assert vec2.tuple(np.array([(1, 2, 3), (4, 5, 6)])) == ((1, 2), (4, 5))
+
+
 def test_vec2_as_tuple(vec2):
     v = vec2(1, 2)
     assert v[0] == 1
@@ -162,6 +168,22 @@ def test_bool(vcls):
     assert not vcls(1e-8, 0).is_null
 
 
+def test_bool_nan(vcls):
+    v = vcls(math.nan, 0)
+    assert v.is_null is False
+    assert bool(v) is True
+
+
+@pytest.mark.parametrize(
+    "x",
+    [0.0, -0.0, 1e-12, -1e-12, 1.1e-12, -1.1e-12, 1e-8, math.nan, math.inf],
+)
+def test_bool_is_not_null(x, vcls):
+    # __bool__() inlines the "is_null" test and must not deviate from it
+    for v in (vcls(x, 0), vcls(0, x)):
+        assert bool(v) is (not v.is_null)
+
+
 def test_magnitude(vcls):
     v = vcls(3, 4)
     assert math.isclose(abs(v), 5)
@@ -184,7 +184,7 @@ def test_subdivide_params():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def weired_spline1():
     # test spline from: 'CADKitSamples\Tamiya TT-01.dxf'
     control_points = [
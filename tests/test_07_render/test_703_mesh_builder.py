@@ -296,6 +296,14 @@ def test_from_cube_polyface(cube_polyface):
     assert len(b.faces) == 6
 
 
+def test_vertex_merger_from_cube_polyface(cube_polyface):
+    b = MeshVertexMerger.from_polyface(cube_polyface)
+    expected = MeshVertexMerger.from_mesh(MeshBuilder.from_polyface(cube_polyface))
+    assert len(b.vertices) == 8
+    assert b.vertices == expected.vertices
+    assert b.faces == expected.faces
+
+
 def test_render_polyface(cube_polyface, msp):
     t = MeshTransformer.from_polyface(cube_polyface)
     assert len(t.vertices) == 24  # unoptimized mesh builder
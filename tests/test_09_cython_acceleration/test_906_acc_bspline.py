@@ -158,6 +158,22 @@ def test_weighted_point_evaluator(py_weval, cy_weval, t_vector):
     assert close_vectors(py_points, cy_points) is True
 
 
+def test_weighted_point_evaluator_for_span_less_than_degree(
+    py_weval, cy_weval, py_wbasis, cy_wbasis
+):
+    # unclamped knot vector: the parameters in front of KNOTS[ORDER - 1] are
+    # located in a span < degree
+    t_vector = [0.5, 1.0, 1.5, 2.0, 2.5]
+    for u in t_vector:
+        span = cy_wbasis.find_span(u)
+        assert span < ORDER - 1
+        assert span == py_wbasis.find_span(u)
+        assert cy_wbasis.basis_funcs(span, u) == py_wbasis.basis_funcs(span, u)
+    py_points = list(py_weval.points(t_vector))
+    cy_points = list(cy_weval.points(t_vector))
+    assert close_vectors(py_points, cy_points) is True
+
+
 def test_weighted_derivative_evaluator(py_weval, cy_weval, t_vector):
     py_ders = list(py_weval.derivatives(t_vector, 2))
     cy_ders = list(cy_weval.derivatives(t_vector, 2))